@@ -21,7 +21,7 @@ setup(
         "requests>=2.26.0",
         "lmdb>=1.0.0",
         "huggingface-hub>=0.11.0",
-        "pydantic>=1.8.0",
+        "pydantic>=2.0.0",
         "litellm>=0.1.0",
     ],
     extras_require={
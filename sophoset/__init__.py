@@ -51,14 +51,12 @@ def setup_logging(level: int = logging.INFO) -> None:
 
 # Make key classes easily importable
 from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
-from sophoset.utils.dataset_explorer import DatasetExplorer
 from sophoset.utils.dataset_exporter import DatasetExporter
 from sophoset.utils.lmdb_storage import LMDBStorage
 
 __all__ = [
     'BaseHFDataset',
     'QAData',
-    'DatasetExplorer',
     'DatasetExporter',
     'LMDBStorage',
     'setup_logging',
@@ -13,15 +13,19 @@ import random
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field, asdict
 from io import BytesIO
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union, Tuple
+from typing import Callable, Dict, Any, Iterator, List, Optional, Union, Tuple
 
-from datasets import load_dataset, get_dataset_config_names, get_dataset_split_names
+from datasets import Image as ImageFeature, load_dataset, get_dataset_config_names, get_dataset_split_names
 from PIL import Image
 from tqdm import tqdm
 
 logger = logging.getLogger(__name__)
 
+# Option letters A-Z used by get_formatted_options
+_OPTION_LETTERS = tuple(chr(65 + i) for i in range(26))
+
 @dataclass
 class QAData:
     """Standardized data structure for question-answer pairs.
@@ -53,6 +57,12 @@ class BaseHFDataset(ABC):
     in the extract_row_data method.
     """
     
+    # Number of rows pulled from the dataset per call in the batched extraction path
+    BATCH_SIZE = 1000
+    # Columns decoded for batch_extract(); None decodes every column. Subclasses
+    # that read some columns straight from Arrow can leave them out here.
+    BATCH_COLUMNS: Optional[List[str]] = None
+
     def __init__(self, dataset_name: str):
         """Initialize the dataset handler.
 
@@ -63,6 +73,11 @@ class BaseHFDataset(ABC):
         self.dataset = None
         self.subset = None
         self.split = None
+        # "<subset>/<split>/" shared by every key of the loaded split
+        self._key_prefix = ""
+        # If False, load_dataset() leaves image columns as encoded
+        # {'bytes', 'path'} dicts instead of decoding them to PIL images
+        self.decode_images = True
         logger.debug(f"Initialized dataset handler for {dataset_name}")
 
     def load_dataset(self, split_name: str, subset_name: str = 'default') -> None:
@@ -80,7 +95,10 @@ class BaseHFDataset(ABC):
             logger.info(f"Loading dataset {self.dataset_name} (subset: {subset_name}, split: {split_name})")
             self.split = split_name
             self.subset = subset_name
+            self._key_prefix = f"{subset_name}/{split_name}/"
             self.dataset = load_dataset(self.dataset_name, subset_name)[split_name]
+            if not self.decode_images:
+                self.dataset = self._without_image_decoding(self.dataset)
             logger.info(f"Successfully loaded {len(self.dataset)} samples")
         except KeyError as e:
             available_splits = self.get_splits(subset_name)
@@ -98,6 +116,24 @@ class BaseHFDataset(ABC):
             logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
+    @staticmethod
+    def _without_image_decoding(dataset: Any) -> Any:
+        """Return the dataset with its image columns left encoded.
+
+        Casting a column to Image(decode=False) makes rows carry the original
+        {'bytes': ..., 'path': ...} dict, so no image is decoded to pixels.
+
+        Args:
+            dataset: A loaded Hugging Face dataset split
+
+        Returns:
+            The dataset with every top-level image column cast
+        """
+        for name, feature in dataset.features.items():
+            if isinstance(feature, ImageFeature) and feature.decode:
+                dataset = dataset.cast_column(name, ImageFeature(decode=False))
+        return dataset
+
     def is_dataset_loaded(self) -> bool:
         """Check if a dataset is currently loaded.
         
@@ -148,20 +184,60 @@ class BaseHFDataset(ABC):
         if isinstance(options, dict):
             return options
 
-        # If it's a list, convert to dict with letter keys
-        formatted = {}
-        # Generate letters from A to Z
-        letters = [chr(65 + i) for i in range(26)]
-        for i, opt in enumerate(options):
-            if i < len(letters):
-                formatted[letters[i]] = opt
-            else:
+        # If it's a list, pair it with the letters in one C-level pass;
+        # zip stops at Z, so only the overflow needs a Python loop
+        if len(options) > len(_OPTION_LETTERS):
+            for i, opt in enumerate(options[len(_OPTION_LETTERS):], len(_OPTION_LETTERS)):
                 logger.warning(
                     f"Option {i} ({opt}) exceeds maximum of 26 options. Skipping."
                 )
+        return dict(zip(_OPTION_LETTERS, options))
 
-        return formatted
+    @staticmethod
+    def as_image_list(images: Any) -> List[Any]:
+        """Normalize an image column value to a list of images.
+
+        Args:
+            images: A list of images, a single image, or an empty value
+
+        Returns:
+            The images as a list; empty values give an empty list
+        """
+        if isinstance(images, list):
+            return images
+        return [images] if images else []
     
+    @staticmethod
+    def field_getter(*fields: str) -> Callable[[Dict[str, Any]], Tuple[Any, ...]]:
+        """Build a function that returns the given fields of a row as a tuple.
+
+        The lookup uses operator.itemgetter, so the common case of a row that
+        has every field is a single C-level call. Rows missing a field fall
+        back to dict.get() with an empty-string default.
+
+        Args:
+            *fields: Column names to extract, in order
+
+        Returns:
+            Callable taking a row dict and returning a tuple of field values
+
+        Example:
+            >>> get_fields = BaseHFDataset.field_getter('question', 'answer')
+            >>> get_fields({'question': 'What is 2+2?', 'answer': '4'})
+            ('What is 2+2?', '4')
+        """
+        getter = itemgetter(*fields)
+        single = len(fields) == 1
+
+        def get_fields(row: Dict[str, Any]) -> Tuple[Any, ...]:
+            try:
+                values = getter(row)
+            except KeyError:
+                return tuple(row.get(name, '') for name in fields)
+            return (values,) if single else values
+
+        return get_fields
+
     def get_row_count(self) -> int:
         """Return the total number of questions in the dataset.
         
@@ -203,7 +279,7 @@ class BaseHFDataset(ABC):
         return self.extract_row_data(self.dataset[index], index)
 
     def get_key(self, index: int) -> str:
-        return f"{self.subset}/{self.split}/{index}"
+        return self._key_prefix + str(index)
         
     def get_samples(self, max_samples: Optional[int] = None, random_sample: bool = False, seed: Optional[int] = None) -> List[QAData]:
         """Get samples from the loaded dataset with optional random sampling and sample limiting.
@@ -246,18 +322,125 @@ class BaseHFDataset(ABC):
         indices = sorted(indices)
         
         # Collect samples
-        samples = []
+        samples = list(self.iter_samples(indices))
+
+        logger.debug(f"Successfully loaded {len(samples)} samples (requested: {max_samples})")
+        return samples
+    
+    def iter_samples(self, indices: Optional[List[int]] = None) -> Iterator[QAData]:
+        """Iterate over samples of the loaded dataset without materializing them all.
+
+        Rows are pulled from the dataset BATCH_SIZE at a time and handed to
+        batch_extract(). Rows that fail to extract are logged and skipped.
+
+        Args:
+            indices: Sorted, unique row indices to extract. Defaults to all rows.
+
+        Yields:
+            QAData objects in index order.
+
+        Raises:
+            RuntimeError: If no dataset is loaded.
+        """
+        if not self.is_dataset_loaded():
+            raise RuntimeError("No dataset loaded. Call load_dataset() first.")
+        if indices is None:
+            indices = list(range(len(self.dataset)))
+
+        yield from self._iter_samples_batched(indices)
+
+    def stream_samples(self, split_name: str, subset_name: str = 'default', prefetch: int = 8) -> Iterator[QAData]:
+        """Stream samples of a split without downloading or loading it all first.
+
+        The split is opened with streaming=True and read ahead in a background
+        thread by sophoset.utils.prefetch, so fetching and decoding the next
+        rows overlaps with extraction and whatever the caller does with each
+        sample.
+        The state of a split loaded with load_dataset() is left untouched, so
+        get_key() and get_row_data() keep producing keys for that split.
+
+        Args:
+            split_name: The name of the split to stream
+            subset_name: Optional subset/configuration name. Defaults to 'default'.
+            prefetch: Maximum number of rows buffered ahead of the consumer
+
+        Yields:
+            QAData objects in row order. Rows that fail to extract are logged and skipped.
+
+        Raises:
+            RuntimeError: If the split cannot be opened or reading from it fails
+        """
+        try:
+            stream = load_dataset(self.dataset_name, subset_name, split=split_name, streaming=True)
+        except Exception as e:
+            error_msg = (
+                f"Error streaming {self.dataset_name} dataset "
+                f"(split: {split_name}, subset: {subset_name}): {str(e)}"
+            )
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+        # extract_row_data() keys rows by the loaded split, so rekey them
+        key_prefix = f"{subset_name}/{split_name}/"
+
+        # Imported here: sophoset.utils imports the exporter, which imports this module
+        from sophoset.utils.prefetch import prefetch as prefetch_rows
+
+        rows = prefetch_rows(stream, size=prefetch, name=f"stream-{self.dataset_name}")
+        try:
+            index = 0
+            while True:
+                try:
+                    row = next(rows)
+                except StopIteration:
+                    return
+                except Exception as e:
+                    raise RuntimeError(f"Error streaming {self.dataset_name}: {str(e)}") from e
+                try:
+                    sample = self.extract_row_data(row, index)
+                except Exception as e:
+                    logger.warning(f"Error processing row {index}: {str(e)}")
+                else:
+                    sample.key = key_prefix + str(index)
+                    yield sample
+                index += 1
+        finally:
+            # Stops the background reader when the caller stops early
+            rows.close()
+
+    def _iter_samples_by_row(self, indices: List[int]) -> Iterator[QAData]:
+        """Extract samples one row at a time, skipping rows that fail."""
         for idx in indices:
             try:
-                row_data = self.get_row_data(idx)
-                samples.append(row_data)
+                yield self.get_row_data(idx)
             except Exception as e:
                 logger.warning(f"Error processing row {idx}: {str(e)}")
                 continue
 
-        logger.debug(f"Successfully loaded {len(samples)} samples (requested: {max_samples})")
-        return samples
-    
+    def _iter_samples_batched(self, indices: List[int]) -> Iterator[QAData]:
+        """Extract samples in column batches via batch_extract().
+
+        A batch that fails as a whole is retried row by row so that a single
+        bad row does not drop its neighbours.
+        """
+        # indices are sorted and unique, so equal length means the full range
+        selected = self.dataset if len(indices) == len(self.dataset) else self.dataset.select(indices)
+        if self.BATCH_COLUMNS is not None:
+            selected = selected.select_columns(self.BATCH_COLUMNS)
+
+        for start in range(0, len(indices), self.BATCH_SIZE):
+            batch_indices = indices[start:start + self.BATCH_SIZE]
+            try:
+                batch = selected[start:start + self.BATCH_SIZE]
+                samples = self.batch_extract(batch, batch_indices)
+            except Exception as e:
+                logger.warning(
+                    f"Error processing rows {batch_indices[0]}-{batch_indices[-1]} as a batch: "
+                    f"{str(e)}. Falling back to per-row extraction."
+                )
+                samples = self._iter_samples_by_row(batch_indices)
+            yield from samples
+
     def get_subsets(self) -> List[str]:
         """Get the list of available subsets/configurations for a dataset.
 
@@ -347,6 +530,31 @@ class BaseHFDataset(ABC):
             QAData object containing the formatted row data
         """
         pass
+
+    def batch_extract(self, batch: Dict[str, List[Any]], indices: List[int]) -> List['QAData']:
+        """Extract and format data from a batch of rows in columnar form.
+
+        The default rebuilds a row dict from the column slices and calls
+        extract_row_data() for each row, so every dataset still benefits from
+        fetching its rows in one slice. Subclasses whose extraction is a direct
+        column mapping can override this to avoid building the row dicts.
+
+        Args:
+            batch: Mapping of column name to the list of values in the batch
+            indices: The dataset indices of the rows in the batch
+
+        Returns:
+            List of QAData objects, one per extracted row in the batch
+        """
+        columns = list(batch.items())
+        samples = []
+        for pos, index in enumerate(indices):
+            try:
+                row = {name: values[pos] for name, values in columns}
+                samples.append(self.extract_row_data(row, index))
+            except Exception as e:
+                logger.warning(f"Error processing row {index}: {str(e)}")
+        return samples
     
     def get_random_row_index(self) -> int:
         """Get a random question index.
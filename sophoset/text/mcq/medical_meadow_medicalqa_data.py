@@ -1,4 +1,5 @@
 from typing import Dict, Any, List, Optional
+import logging
 import re
 import ast
 
@@ -6,6 +7,8 @@ from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
 from sophoset.utils.dataset_explorer import DatasetExplorer
 
+logger = logging.getLogger(__name__)
+
 class MedicalMedowMedQADataset(BaseHFDataset):
     """A class to handle loading and managing the MedicalMeadowMedQA dataset."""
     
@@ -48,7 +51,7 @@ class MedicalMedowMedQADataset(BaseHFDataset):
                     question = question[2:].strip()
                 options_list = list(options_dict.values())
             except (ValueError, SyntaxError):
-                print(f"Error parsing options for row {index}. Skipping...")
+                logger.warning(f"Error parsing options for row {index}. Skipping...")
                 question = input_text
                 options_list = []
         else:
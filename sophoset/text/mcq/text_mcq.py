@@ -1,7 +1,17 @@
+import json
 import os
+import re
 from litellm import completion
 from pydantic import BaseModel
-from typing import List
+from typing import List, Tuple
+
+# Option letters A-Z, computed once instead of calling chr() per option.
+LETTERS = [chr(65 + i) for i in range(26)]
+
+# Patterns used to recover a response when the model output is not valid JSON.
+_JSON_BLOCK_RE = re.compile(r'\{.*\}', re.S)
+_ANSWER_RE = re.compile(r'Answer\s*:\s*([A-Z])\b', re.I)
+_EXPL_RE = re.compile(r'\s*([A-Z])\.\s*(True|False)\s*:\s*(.+?)\s*$', re.I)
 
 class Explanation(BaseModel):
     option: str
@@ -12,6 +22,9 @@ class ModelResponse(BaseModel):
     answer: str
     explanations: List[Explanation]
 
+class BatchModelResponse(BaseModel):
+    responses: List[ModelResponse]
+
 class PromptGenerator:
     """
     A class to handle the generation of multiple-choice question prompts
@@ -20,54 +33,49 @@ class PromptGenerator:
     def generate_prompt(self, question: str, options: List[str]) -> str:
         """
         Generates a multiple-choice question prompt for an LLM.
-        The prompt is broken down into four parts: Persona, Task, Output Format, and Specific Instructions.
+        The prompt is broken down into two parts: Task and Specific Instructions.
         """
         
         # 1. Task
-        task_prompt = f"Answer the following multiple-choice question.\n\nQuestion: {question}\n\nOptions:\n"
-        for i, option in enumerate(options):
-            # Using A, B, C, D, E... for options
-            task_prompt += f"{chr(65 + i)}. {option}\n"
-
-        # 2. Output Format
-        output_format_prompt = """
-Please provide the correct option and a detailed explanation for each choice, formatted as follows:
+        # Using A, B, C, D, E... for options
+        option_lines = "".join(f"{letter}. {option}\n" for letter, option in zip(LETTERS, options))
+        task_prompt = (
+            f"Answer the following multiple-choice question.\n\nQuestion: {question}\n\nOptions:\n"
+            + option_lines
+        )
 
-Answer: 
+        # 2. Specific Instructions
+        # The response shape is enforced by the ModelResponse schema passed as
+        # response_format, so the prompt only needs to describe the content.
+        specific_instructions_prompt = (
+            "Give the letter of the correct option as the answer, and for every option "
+            "state whether it is correct together with a short explanation."
+        )
 
-Explanations:
+        full_prompt = f"{task_prompt}\n{specific_instructions_prompt}"
+        return full_prompt.strip()
 
-"""
-        for i in range(len(options)):
-            option_letter = chr(65 + i)
-            output_format_prompt += f"{option_letter}. True/False: [Your explanation for Option {option_letter}]\n"
-        
-        # Example part remains static and provides a clear template.
-        output_format_prompt += """
-Example:
-
-Question: What is the primary function of insulin in the human body?
-Options:
-A. Producing red blood cells
-B. Regulating blood glucose levels
-C. Digesting proteins in the stomach
-D. Storing fat in adipose tissue
-
-Answer: B
-
-Explanations:
-
-A. False: red blood cells are produced in the bone marrow.
-B. True:  insulin's primary role is to help cells absorb glucose from the bloodstream, thereby lowering blood sugar.
-C. False: proteins are digested by enzymes like pepsin in the stomach.
-D. False: while insulin helps in fat storage, its primary function is glucose regulation, not just fat storage.
-"""
-        
-        # 3. Specific Instructions
-        specific_instructions_prompt = """
-Your response for the question above should start with the correct option letter, followed by your explanations for all options in the format shown."""
+    def generate_batch_prompt(self, items: List[Tuple[str, List[str]]]) -> str:
+        """
+        Generates a single prompt asking the LLM to answer several multiple-choice
+        questions at once, returning one response per question in order.
+        """
+        questions = []
+        for number, (question, options) in enumerate(items, 1):
+            option_lines = "".join(f"{letter}. {option}\n" for letter, option in zip(LETTERS, options))
+            questions.append(f"Question {number}: {question}\nOptions:\n{option_lines}")
+
+        task_prompt = (
+            f"Answer the following {len(items)} multiple-choice questions.\n\n"
+            + "\n".join(questions)
+        )
+        specific_instructions_prompt = (
+            "Return one response per question, in the same order as the questions. For each, "
+            "give the letter of the correct option as the answer, and for every option "
+            "state whether it is correct together with a short explanation."
+        )
 
-        full_prompt = f"{task_prompt}\n\n{output_format_prompt}\n\n{specific_instructions_prompt}"
+        full_prompt = f"{task_prompt}\n{specific_instructions_prompt}"
         return full_prompt.strip()
 
 class TextMCQ:
@@ -93,31 +101,122 @@ class TextMCQ:
         Asks a text-based multiple-choice question to an LLM using litellm
         and returns a structured ModelResponse with response validation via Pydantic.
         """
+        self._validate_question(question, options)
+
+        user_prompt = self.prompt_generator.generate_prompt(question, options)
+        response = self._complete(user_prompt, ModelResponse)
+
+        # response_format returns the parsed object directly for Pydantic models
+        if hasattr(response, 'parsed'):
+            return response.parsed
+        return self.parse_llm_response(response.choices[0].message.content)
+
+    def get_responses_batch(self, items: List[Tuple[str, List[str]]], k: int = 8) -> List[ModelResponse]:
+        """
+        Asks several multiple-choice questions using one LLM request per group of
+        `k` questions and returns one ModelResponse per question, in input order.
+
+        Raises:
+            ValueError: If a question is invalid or the LLM returns the wrong
+                        number of responses for a group.
+        """
+        if k < 1:
+            raise ValueError("The batch size 'k' must be at least 1.")
+        for question, options in items:
+            self._validate_question(question, options)
+
+        results = []
+        for start in range(0, len(items), k):
+            group = items[start:start + k]
+            user_prompt = self.prompt_generator.generate_batch_prompt(group)
+            response = self._complete(user_prompt, BatchModelResponse)
+
+            if hasattr(response, 'parsed'):
+                batch = response.parsed
+            else:
+                batch = BatchModelResponse.model_validate_json(response.choices[0].message.content)
+
+            if len(batch.responses) != len(group):
+                raise ValueError(
+                    f"Expected {len(group)} responses from the LLM, got {len(batch.responses)}."
+                )
+            results.extend(batch.responses)
+        return results
+
+    @staticmethod
+    def _validate_question(question: str, options: List[str]) -> None:
+        """
+        Checks that a question is non-empty and has more than one option.
+        """
         if not question:
             raise ValueError("The 'question' cannot be empty.")
         if not isinstance(options, list) or len(options) <= 1:
             raise ValueError("The 'options' must be a list with more than one element.")
 
-        user_prompt = self.prompt_generator.generate_prompt(question, options)
-
+    def _complete(self, user_prompt: str, response_format: type):
+        """
+        Sends the user prompt (and system prompt, if set) to the LLM.
+        """
         messages = []
         if self.system_prompt:
             messages.append({"role": "system", "content": self.system_prompt})
 
         messages.append({"role": "user", "content": user_prompt})
 
-        response = completion(
+        return completion(
             model=self.model,
             messages=messages,
             temperature=self.temperature,
-            response_format=ModelResponse
+            response_format=response_format
         )
 
-        # response_format returns the parsed object directly for Pydantic models
-        if hasattr(response, 'parsed'):
-            return response.parsed
-        else:
-            return response
+    def parse_llm_response(self, raw_text: str) -> ModelResponse:
+        """
+        Parses the raw LLM output into a ModelResponse without re-querying the model.
+
+        Tries, in order: direct JSON parsing, extraction of the outermost JSON
+        object embedded in surrounding text, and finally pattern matching of a
+        plain-text "Answer: X" / "A. True: ..." response.
+
+        Raises:
+            ValueError: If none of the strategies yields a valid response.
+        """
+        raw_text = raw_text or ""
+
+        try:
+            return ModelResponse.model_validate_json(raw_text)
+        except ValueError:
+            pass
+
+        block = _JSON_BLOCK_RE.search(raw_text)
+        if block:
+            try:
+                return ModelResponse.model_validate(json.loads(block.group(0)))
+            except ValueError:
+                pass
+
+        # Single pass over the lines: the first "Answer:" line gives the answer,
+        # and every "X. True/False: ..." line gives an explanation.
+        answer = None
+        explanations = []
+        for line in raw_text.splitlines():
+            expl_match = _EXPL_RE.match(line)
+            if expl_match:
+                # The regex groups already have the schema's types, so build the
+                # models without running Pydantic validation for every line.
+                explanations.append(Explanation.model_construct(
+                    option=expl_match[1].upper(),
+                    is_correct=expl_match[2].lower() == 'true',
+                    text=expl_match[3]
+                ))
+            elif answer is None:
+                answer_match = _ANSWER_RE.search(line)
+                if answer_match:
+                    answer = answer_match[1].upper()
+
+        if answer is None:
+            raise ValueError("Could not parse a valid answer from the LLM response.")
+        return ModelResponse.model_construct(answer=answer, explanations=explanations)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,4 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
@@ -27,25 +27,12 @@ class WinoGrandeDataset(BaseHFDataset):
         # Extract question and options
         question = row.get('sentence', '')
 
-        # Get distractors and combine with correct answer
-        options_list = [
-            row.get('option1', ''),
-            row.get('option2', '')
-        ]
-        answer = row.get('answer', '')
-
-        try:
-           answer = chr(ord('A') + int(answer)-1)
-        except ValueError:
-           answer = "-"
-
-        # Format options as dict with letter keys (A, B, C, D, E, etc.)
-        formatted_options = {}
-        if options_list:
-            letters = [chr(65 + i) for i in range(26)]
-            for i, opt in enumerate(options_list):
-                if i < len(letters):
-                    formatted_options[letters[i]] = opt
+        # WinoGrande always has exactly two options
+        formatted_options = {
+            'A': row.get('option1', ''),
+            'B': row.get('option2', '')
+        }
+        answer = self._answer_letter(row.get('answer', ''))
 
         return QAData(
             key=self.get_key(index),
@@ -54,6 +41,36 @@ class WinoGrandeDataset(BaseHFDataset):
             answer=answer
         )
 
+    def batch_extract(self, batch: Dict[str, List[Any]], indices: List[int]) -> List[QAData]:
+        """Extract WinoGrande rows column-wise.
+
+        Args:
+            batch: Mapping of column name to the list of values in the batch
+            indices: The dataset indices of the rows in the batch
+
+        Returns:
+            List of QAData objects, one per row in the batch
+        """
+        return [
+            QAData(
+                key=self.get_key(index),
+                question=question,
+                options={'A': option1, 'B': option2},
+                answer=self._answer_letter(answer)
+            )
+            for index, question, option1, option2, answer in zip(
+                indices, batch['sentence'], batch['option1'], batch['option2'], batch['answer']
+            )
+        ]
+
+    @staticmethod
+    def _answer_letter(answer: str) -> str:
+        """Map the 1-based answer string ('1'/'2') to its option letter."""
+        # Unlabelled (test split) rows have an empty answer
+        if answer.isdigit() and answer != '0':
+            return chr(64 + int(answer))
+        return "-"
+
 
 if __name__ == "__main__":
     dset = WinoGrandeDataset()
@@ -1,9 +1,11 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any
 
 from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
 from sophoset.utils.dataset_explorer import DatasetExplorer
 
+_get_fields = BaseHFDataset.field_getter('Question', 'Answer')
+
 class MedQuadMedQnADataset(BaseHFDataset):
     """A class to handle loading and managing the MedQuad-MedicalQnA dataset."""
     
@@ -24,8 +26,7 @@ class MedQuadMedQnADataset(BaseHFDataset):
             QAData object containing the formatted row data
         """
         # Extract question and answer
-        question = row.get('Question', '')
-        answer = row.get('Answer', '')
+        question, answer = _get_fields(row)
         
         return QAData(
             key=self.get_key(index),
@@ -1,4 +1,4 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List
 
 from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
@@ -28,13 +28,7 @@ class Aime2025Dataset(BaseHFDataset):
         question = row.get('question', '')
         
         # Extract options if they exist in the dataset
-        options = {}
-        if 'options' in row:
-            if isinstance(row['options'], list):
-                # Convert list to dict format with letter keys
-                options = {chr(65 + i): opt for i, opt in enumerate(row['options'])}
-            elif isinstance(row['options'], dict):
-                options = row['options']
+        options = self._format_options(row.get('options'))
         
         # Extract answer if it exists
         answer = row.get('answer', '')
@@ -46,6 +40,39 @@ class Aime2025Dataset(BaseHFDataset):
             answer=answer
         )
 
+    def batch_extract(self, batch: Dict[str, List[Any]], indices: List[int]) -> List[QAData]:
+        """Extract AIME 2025 rows column-wise.
+
+        Args:
+            batch: Mapping of column name to the list of values in the batch
+            indices: The dataset indices of the rows in the batch
+
+        Returns:
+            List of QAData objects, one per row in the batch
+        """
+        count = len(indices)
+        questions = batch.get('question') or [''] * count
+        answers = batch.get('answer') or [''] * count
+        options = batch.get('options') or [None] * count
+        return [
+            QAData(
+                key=self.get_key(index),
+                question=question,
+                options=self._format_options(opts),
+                answer=answer
+            )
+            for index, question, opts, answer in zip(indices, questions, options, answers)
+        ]
+
+    @staticmethod
+    def _format_options(options: Any) -> Dict[str, str]:
+        """Convert a list of options to letter keys; dicts are returned as-is."""
+        if isinstance(options, list):
+            return {chr(65 + i): opt for i, opt in enumerate(options)}
+        if isinstance(options, dict):
+            return options
+        return {}
+
 if __name__ == "__main__":
     dset = Aime2025Dataset()
     explorer = DatasetExplorer(dset)
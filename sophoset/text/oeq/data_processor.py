@@ -1,10 +1,11 @@
+import functools
 import importlib
 import logging
 import os
-import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, Optional, Set, Type
 
 # Configure logging to only write to file
 logging.basicConfig(
@@ -17,7 +18,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 from sophoset.core.base_hf_dataset import BaseHFDataset
-from sophoset.utils.lmdb_storage import DataStorage
+from sophoset.utils.lmdb_storage import LMDBStorage, Config
 
 from text_oeq import TextOEQ
 
@@ -89,8 +90,9 @@ class DatasetProcessor:
     """Processes datasets using a specified model and handles storage of responses."""
     
     @classmethod
-    def load_dataset(cls, dataset_name: str) -> BaseHFDataset:
-        """Dynamically load a dataset module and return an instance of the dataset class."""
+    @functools.lru_cache(maxsize=None)
+    def _resolve_class(cls, dataset_name: str) -> Type[BaseHFDataset]:
+        """Import the dataset module once and return its BaseHFDataset subclass."""
         if dataset_name not in cls.DATASET_MODULES:
             error_msg = f"Unknown dataset: {dataset_name}"
             logger.error(error_msg)
@@ -104,7 +106,7 @@ class DatasetProcessor:
                 if (isinstance(obj, type) and 
                     issubclass(obj, BaseHFDataset) and 
                     obj != BaseHFDataset):
-                    return obj()
+                    return obj
             error_msg = f"Could not find dataset class in {module_name}"
             logger.error(error_msg)
             raise ImportError(error_msg)
@@ -112,18 +114,28 @@ class DatasetProcessor:
             error_msg = f"Failed to import dataset {dataset_name}: {str(e)}"
             logger.error(error_msg)
             raise ImportError(error_msg)
+
+    @classmethod
+    def load_dataset(cls, dataset_name: str) -> BaseHFDataset:
+        """Dynamically load a dataset module and return an instance of the dataset class."""
+        return cls._resolve_class(dataset_name)()
             
-    def __init__(self, data_config: 'DataConfig', model_config: 'ModelConfig', update_existing: bool = False):
+    def __init__(self, data_config: 'DataConfig', model_config: 'ModelConfig', update_existing: bool = False,
+                 max_workers: int = 4):
         """Initialize the dataset processor.
         
         Args:
             data_config: Configuration for dataset loading and processing
             model_config: Configuration for the model
             update_existing: Whether to update existing responses
+            max_workers: Number of samples sent to the model concurrently
         """
         self.data_config = data_config
         self.model_config = model_config
         self.update_existing = update_existing
+        self.max_workers = max(1, max_workers)
+        # Storage keys are "<sample key>:<model name>"; build the suffix once
+        self._key_suffix = f":{model_config.name}"
 
         # Create results directory if it doesn't exist
         results_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
@@ -133,7 +145,15 @@ class DatasetProcessor:
         dbname = dbname.replace(" ", "_").replace("/", "_")
         dbname = os.path.join(results_dir, f"{dbname}_lmdb")
 
-        self.storage = DataStorage(dbname)
+        # Commits are not flushed one by one; storage.sync() runs when processing
+        # ends. writemap is left off: it would extend data.mdb to the whole map
+        # size, and a crash could corrupt responses that are costly to redo.
+        self.storage = LMDBStorage(Config(
+            db_path=dbname,
+            serializer="json",
+            sync=False,
+            metasync=False
+        ))
 
         self.llm_model = TextOEQ(
             model=model_config.name,
@@ -153,6 +173,9 @@ class DatasetProcessor:
         except Exception as e:
             print(f"Error processing dataset {self.data_config.name}: {str(e)}")
             raise
+        finally:
+            # Commits are not synced individually, so flush them once here
+            self.storage.sync()
     
     def _load_dataset(self) -> BaseHFDataset:
         """Load and return the dataset using the class method."""
@@ -203,32 +226,59 @@ class DatasetProcessor:
                 total_samples = len(samples)
                 logger.info(f"Processing {total_samples} samples...")
                 
-                # Initialize tqdm progress bar
-                progress_bar = tqdm(
-                    samples,
-                    desc=f"{subset}-{split}",
-                    unit="sample",
-                    leave=True  # Ensures the progress bar stays visible after completion
-                )
+                # Look up already-stored responses for this split in one cursor scan
+                existing_keys = set() if self.update_existing else self.storage.keys_startingwith(f"{subset}/{split}/")
                 
-                for sample in progress_bar:
-                    try:
-                        self._process_sample(sample)
-                    except Exception as e:
-                        logger.error(f"Error processing sample: {str(e)}")
-                        if not self.update_existing:
-                            raise
+                # Model calls are network-bound, so overlap them on a thread pool
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    futures = [
+                        executor.submit(self._process_sample, sample, existing_keys)
+                        for sample in samples
+                    ]
+                    
+                    # Initialize tqdm progress bar
+                    progress_bar = tqdm(
+                        as_completed(futures),
+                        total=total_samples,
+                        desc=f"{subset}-{split}",
+                        unit="sample",
+                        leave=True,  # Ensures the progress bar stays visible after completion
+                        # Refresh rarely so skipped (already stored) samples are not dominated by redraws
+                        miniters=max(1, total_samples // 500),
+                        mininterval=0.5,
+                        smoothing=0
+                    )
+                    
+                    for future in progress_bar:
+                        try:
+                            future.result()
+                        except Exception as e:
+                            logger.error(f"Error processing sample: {str(e)}")
+                            if not self.update_existing:
+                                for pending in futures:
+                                    pending.cancel()
+                                raise
                     
         except Exception as e:
             logger.error(f"Error processing subset {subset}: {str(e)}")
             raise
     
-    def _process_sample(self, sample: Any) -> None:
-        """Process a single sample from the dataset."""
+    def _process_sample(self, sample: Any, existing_keys: Optional[Set[str]] = None) -> None:
+        """Process a single sample from the dataset.
+        
+        Args:
+            sample: The sample to send to the model
+            existing_keys: Storage keys already present; when None, storage is queried directly
+        """
         try:
-            storage_key = f"{sample.key}:{self.model_config.name}"
+            storage_key = sample.key + self._key_suffix
+            
+            if existing_keys is not None:
+                exists = storage_key in existing_keys
+            else:
+                exists = self.storage.has_key(storage_key)
             
-            if not self.update_existing and self.storage.get(storage_key) is not None:
+            if not self.update_existing and exists:
                 logger.debug(f"Skipping existing response for key: {storage_key}")
                 return
             
@@ -1,9 +1,11 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List
 
 from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
 from sophoset.utils.dataset_explorer import DatasetExplorer
 
+_get_fields = BaseHFDataset.field_getter('problem', 'answer', 'solution')
+
 class DeepScaleRDataset(BaseHFDataset):
     """A class to handle loading and managing the DeepScaleR dataset."""
     
@@ -23,9 +25,7 @@ class DeepScaleRDataset(BaseHFDataset):
         Returns:
             QAData object containing the formatted row data
         """
-        question = row.get('problem', '')
-        answer = row.get('answer', '')
-        explanation = row.get('solution', '')
+        question, answer, explanation = _get_fields(row)
         
         return QAData(
             key=self.get_key(index),
@@ -34,6 +34,27 @@ class DeepScaleRDataset(BaseHFDataset):
             explanation=explanation
         )
 
+    def batch_extract(self, batch: Dict[str, List[Any]], indices: List[int]) -> List[QAData]:
+        """Extract DeepScaleR rows column-wise.
+
+        Args:
+            batch: Mapping of column name to the list of values in the batch
+            indices: The dataset indices of the rows in the batch
+
+        Returns:
+            List of QAData objects, one per row in the batch
+        """
+        return [
+            QAData(
+                key=self.get_key(index),
+                question=question,
+                answer=answer,
+                explanation=explanation
+            )
+            for index, question, answer, explanation
+            in zip(indices, batch['problem'], batch['answer'], batch['solution'])
+        ]
+
 if __name__ == "__main__":
     dset = DeepScaleRDataset()
     explorer = DatasetExplorer(dset)
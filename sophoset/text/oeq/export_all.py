@@ -0,0 +1,123 @@
+"""
+Export the open-ended text datasets from a single process.
+
+Running each dataset module's __main__ block separately pays interpreter
+startup and the datasets/pyarrow imports once per dataset. This entrypoint
+imports them once and exports every requested dataset in turn.
+
+Usage:
+    python -m sophoset.text.oeq.export_all -o datasets
+    python -m sophoset.text.oeq.export_all -d gsm8k math_lighteval -f json
+"""
+
+import argparse
+import importlib
+import logging
+from typing import List, Type
+
+from sophoset.core.base_hf_dataset import BaseHFDataset
+from sophoset.utils.dataset_exporter import DatasetExporter
+
+logger = logging.getLogger(__name__)
+
+# Dictionary mapping dataset names to their module names in this package
+DATASET_MODULES = {
+    "aime2025": "aime2025_data",
+    "deepscaler": "deepscaler_data",
+    "gpqa": "gpqa_data",
+    "gsm8k": "gsm8k_data",
+    "gsmplus": "gsmplus",
+    "imo_geometry": "imo_geometry_data",
+    "math_lighteval": "math_lighteval_data",
+    "mathplus": "mathplus_data",
+    "medical_meadow_flashcards": "medical_meadow_flashcards_data",
+    "medical_meadow_wikidoc": "medical_meadow_wikidoc_data",
+    "medicalquestions": "medicalquestions_data",
+    "medicationqa": "medicationqa_data",
+    "medqa": "medqa_data",
+    "medqnav3": "medqnav3_data",
+    "medquad": "medquad_data",
+    "medquad_medqna": "MedQuad-MedQnA_data",
+    "metamathqa_40k": "metamathqa-40k_data",
+    "metamathqa": "metamathqa_data",
+    "olympiads": "olympiads_data",
+    "openmedcases": "openmedcases_data",
+    "pubmedqa": "pubmedqa_data",
+    "safetybench": "safetybench_data",
+    "scibench": "scibench_data",
+    "simpleqa": "simpleqa_data",
+    "toxic_prompts": "toxic_prompts",
+    "truthfulqa": "truthfulqa_data"
+}
+
+
+def load_dataset_class(dataset_name: str) -> Type[BaseHFDataset]:
+    """Import a dataset module and return its BaseHFDataset subclass.
+
+    Raises:
+        ValueError: If the dataset name is unknown
+        ImportError: If the module cannot be imported or has no dataset class
+    """
+    if dataset_name not in DATASET_MODULES:
+        raise ValueError(f"Unknown dataset: {dataset_name}. Available datasets: {', '.join(DATASET_MODULES.keys())}")
+
+    module = importlib.import_module(f"{__package__ or 'sophoset.text.oeq'}.{DATASET_MODULES[dataset_name]}")
+    for obj in module.__dict__.values():
+        if isinstance(obj, type) and issubclass(obj, BaseHFDataset) and obj is not BaseHFDataset:
+            return obj
+    raise ImportError(f"Could not find dataset class in {DATASET_MODULES[dataset_name]}")
+
+
+def export_all(dataset_names: List[str], format: str = 'lmdb', output_dir: str = 'datasets', **kwargs) -> List[str]:
+    """Export several datasets one after another in this process.
+
+    A dataset that fails to import or export is logged and skipped so the
+    remaining datasets are still exported.
+
+    Args:
+        dataset_names: Names from DATASET_MODULES to export
+        format: The output format ('json' or 'lmdb')
+        output_dir: Directory to save the output files
+        **kwargs: Additional arguments passed to DatasetExporter.save
+
+    Returns:
+        List[str]: The names of the datasets that failed
+    """
+    failed = []
+    for name in dataset_names:
+        try:
+            dataset = load_dataset_class(name)()
+            logger.info(f"Exporting {name} ({dataset.dataset_name}) as {format}")
+            DatasetExporter.save(dataset, format=format, output_dir=output_dir, **kwargs)
+        except Exception as e:
+            logger.error(f"Failed to export dataset {name}: {e}")
+            failed.append(name)
+    return failed
+
+
+def process_arguments():
+    """Process command line arguments."""
+    parser = argparse.ArgumentParser(description='Export open-ended text datasets to JSON or LMDB')
+    parser.add_argument("-d", "--datasets", nargs='+', default=list(DATASET_MODULES.keys()),
+                        choices=list(DATASET_MODULES.keys()), metavar='DATASET',
+                        help=f'Datasets to export (default: all). Available: {", ".join(DATASET_MODULES.keys())}')
+    parser.add_argument("-f", "--format", type=str, default='lmdb', choices=['json', 'lmdb'],
+                        help='Output format')
+    parser.add_argument("-o", "--output-dir", type=str, default='datasets',
+                        help='Directory to save the exported files')
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help='Number of processes used to extract rows')
+    return parser.parse_args()
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    args = process_arguments()
+    failed = export_all(args.datasets, format=args.format, output_dir=args.output_dir,
+                        num_workers=args.workers)
+    if failed:
+        logger.error(f"Failed to export: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
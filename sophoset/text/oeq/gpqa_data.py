@@ -1,9 +1,11 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any
 
 from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
 from sophoset.utils.dataset_explorer import DatasetExplorer
 
+_get_fields = BaseHFDataset.field_getter('Pre-Revision Question', 'Pre-Revision Correct Answer', 'Pre-Revision Explanation')
+
 class GpqaDataset(BaseHFDataset):
     """A class to handle loading and managing the GPQA dataset."""
     
@@ -25,9 +27,7 @@ class GpqaDataset(BaseHFDataset):
             QAData object containing the formatted row data
         """
         # Extract question text
-        question = row.get('Pre-Revision Question', '')
-        answer   = row.get('Pre-Revision Correct Answer', '')
-        explanation   = row.get('Pre-Revision Explanation', '')
+        question, answer, explanation = _get_fields(row)
         
         return QAData(
             key=self.get_key(index),
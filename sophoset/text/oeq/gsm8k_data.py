@@ -1,9 +1,11 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List
 
 from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
 from sophoset.utils.dataset_explorer import DatasetExplorer
 
+_get_fields = BaseHFDataset.field_getter('question', 'answer')
+
 class Gsm8kDataset(BaseHFDataset):
     """A class to handle loading and managing the GSM8K dataset."""
     
@@ -25,22 +27,52 @@ class Gsm8kDataset(BaseHFDataset):
             QAData object containing the formatted row data
         """
         # Extract question and answer
-        question = row.get('question', '')
-        answer = row.get('answer', '')
-        
-        # For GSM8K, the answer typically includes the reasoning steps
-        # We'll extract just the final answer for the answer field
-        final_answer = ''
-        if answer and '####' in answer:
-            final_answer = answer.split('####')[-1].strip()
+        question, answer = _get_fields(row)
         
         return QAData(
             key=self.get_key(index),
             question=question,
-            answer=final_answer,
+            answer=self.extract_final_answer(answer),
             explanation = answer
         )
 
+    def batch_extract(self, batch: Dict[str, List[Any]], indices: List[int]) -> List[QAData]:
+        """Extract GSM8K rows column-wise.
+
+        Args:
+            batch: Mapping of column name to the list of values in the batch
+            indices: The dataset indices of the rows in the batch
+
+        Returns:
+            List of QAData objects, one per row in the batch
+        """
+        extract_final_answer = self.extract_final_answer
+        return [
+            QAData(
+                key=self.get_key(index),
+                question=question,
+                answer=extract_final_answer(answer),
+                explanation=answer
+            )
+            for index, question, answer in zip(indices, batch['question'], batch['answer'])
+        ]
+
+    @staticmethod
+    def extract_final_answer(answer: str) -> str:
+        """Extract the final answer that follows the '####' marker.
+
+        For GSM8K, the answer typically includes the reasoning steps, and the
+        final answer is given after the marker.
+
+        Args:
+            answer: The full answer text
+
+        Returns:
+            The final answer, or an empty string if there is no marker
+        """
+        marker = answer.rfind('####') if answer else -1
+        return answer[marker + 4:].strip() if marker >= 0 else ''
+
 if __name__ == "__main__":
     dset = Gsm8kDataset()
     explorer = DatasetExplorer(dset)
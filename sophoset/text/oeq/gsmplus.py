@@ -4,6 +4,8 @@ from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
 from sophoset.utils.dataset_explorer import DatasetExplorer
 
+_get_fields = BaseHFDataset.field_getter('question', 'answer', 'solution')
+
 class GsmPlusDataset(BaseHFDataset):
     """A class to handle loading and managing the GSM-Plus dataset."""
     
@@ -24,9 +26,7 @@ class GsmPlusDataset(BaseHFDataset):
             QAData object containing the formatted row data
         """
         # Extract question and metadata
-        question = row.get('question', '')
-        answer = row.get('answer', '')
-        explanation = row.get('solution', '')
+        question, answer, explanation = _get_fields(row)
         
         return QAData(
             key=self.get_key(index),
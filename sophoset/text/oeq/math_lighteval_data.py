@@ -1,10 +1,13 @@
-from typing import Dict, Any, List, Optional
-import re
+import functools
+from typing import Dict, Any
 
 from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
 from sophoset.utils.dataset_explorer import DatasetExplorer
 
+_BOXED_PREFIX = "\\boxed{"
+_get_fields = BaseHFDataset.field_getter('problem', 'solution')
+
 class MathLightEvalDataset(BaseHFDataset):
     """A class to handle loading and managing the MATH_lighteval dataset."""
     
@@ -14,22 +17,38 @@ class MathLightEvalDataset(BaseHFDataset):
         """Initialize the base class ."""
         super().__init__(self.DATASET_NAME)
 
-    def extract_boxed_value(self, text):
+    @staticmethod
+    @functools.lru_cache(maxsize=65536)
+    def extract_boxed_value(text):
         """
         Extracts the value inside a LaTeX \boxed{} command.
 
+        Nested braces are balanced, so values that contain braces themselves
+        (e.g. fractions) are returned in full. Results are cached by text, since
+        the dataset repeats many identical solutions.
+
         Args:
             text (str): The input string containing the LaTeX code.
 
         Returns:
             str or None: The extracted value if found, otherwise None.
         """
-        # The regular expression looks for the word "boxed" followed by curly braces
-        # The content inside the curly braces is captured using parentheses
-        pattern = r"\\boxed{(.*?)}"
-        match = re.search(pattern, text)
-        if match:
-            return match.group(1)
+        if not text:
+            return None
+        start = text.find(_BOXED_PREFIX)
+        if start < 0:
+            return None
+        start += len(_BOXED_PREFIX)
+
+        depth = 1
+        for pos in range(start, len(text)):
+            char = text[pos]
+            if char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+                if depth == 0:
+                    return text[start:pos]
         return None
 
     
@@ -44,8 +63,7 @@ class MathLightEvalDataset(BaseHFDataset):
             QAData object containing the formatted row data
         """
         # Extract question and solution
-        question = row.get('problem', '')
-        explanation   = row.get('solution', '')
+        question, explanation = _get_fields(row)
         answer  = self.extract_boxed_value(explanation)
         
         return QAData(
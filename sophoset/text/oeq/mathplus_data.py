@@ -1,10 +1,12 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any
 import re
 
 from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
 from sophoset.utils.dataset_explorer import DatasetExplorer
 
+_get_fields = BaseHFDataset.field_getter('instruction', 'output')
+
 class MathPlusDataset(BaseHFDataset):
     """A class to handle loading and managing the MATH-Plus dataset."""
     
@@ -39,8 +41,7 @@ class MathPlusDataset(BaseHFDataset):
             QAData object containing the formatted row data
         """
         # Extract question and solution
-        question = row.get('instruction', '')
-        explanation   = row.get('output', '')
+        question, explanation = _get_fields(row)
         answer        = self.extract_short_answer(explanation)      
         
         return QAData(
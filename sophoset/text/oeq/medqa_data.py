@@ -1,9 +1,11 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any
 
 from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
 from sophoset.utils.dataset_explorer import DatasetExplorer
 
+_get_fields = BaseHFDataset.field_getter('input', 'output')
+
 class MedicalQADataset(BaseHFDataset):
     """A class to handle loading and managing the Medical QA Datasets collection."""
     
@@ -25,8 +27,7 @@ class MedicalQADataset(BaseHFDataset):
             QAData object containing the formatted row data
         """
         # Extract question and answer
-        question = row.get('input', '')
-        answer = row.get('output', '')
+        question, answer = _get_fields(row)
         
         return QAData(
             key=self.get_key(index),
@@ -1,10 +1,12 @@
 from typing import Dict, Any, Optional
-import re
 
 from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
 from sophoset.utils.dataset_explorer import DatasetExplorer
 
+_ANSWER_PREFIX = "The answer is: "
+_get_fields = BaseHFDataset.field_getter('query', 'response')
+
 class MetaMathQA40KDataset(BaseHFDataset):
     """A class to handle loading and managing the MetaMathQA-40K dataset."""
     
@@ -14,7 +16,7 @@ class MetaMathQA40KDataset(BaseHFDataset):
         """Initialize the MetaMathQA-40K dataset handler."""
         super().__init__(self.DATASET_NAME)
 
-    def extract_final_answer(self, text: str) -> str | None:
+    def extract_final_answer(self, text: str) -> Optional[str]:
         """
         Extracts the complete string after 'The answer is: ' in the text.
 
@@ -24,16 +26,12 @@ class MetaMathQA40KDataset(BaseHFDataset):
         Returns:
             The extracted answer string after 'The answer is: ', or None if not found.
         """
-        # Find the position of 'The answer is: ' in the text
-        prefix = "The answer is: "
-        start_idx = text.find(prefix)
-        
-        # If the prefix is found, return everything after it
-        if start_idx != -1:
-            return text[start_idx + len(prefix):].strip()
+        if not text:
+            return None
         
-        # Return None if the prefix is not found
-        return None
+        # Split at the first 'The answer is: '; sep is empty if it is missing
+        _, sep, answer = text.partition(_ANSWER_PREFIX)
+        return answer.strip() if sep else None
     
     def extract_row_data(self, row: Dict[str, Any], index: int) -> QAData:
         """Extract and format data from a MetaMathQA dataset row.
@@ -46,8 +44,7 @@ class MetaMathQA40KDataset(BaseHFDataset):
             QAData object containing the formatted row data
         """
         # Extract question and answer
-        question = row.get('query', '')
-        explanation = row.get('response', '')
+        question, explanation = _get_fields(row)
         answer = self.extract_final_answer(explanation)
         
         return QAData(
@@ -1,9 +1,11 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any
 
 from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
 from sophoset.utils.dataset_explorer import DatasetExplorer
 
+_get_fields = BaseHFDataset.field_getter('problem', 'solution')
+
 class OlympiadsDataset(BaseHFDataset):
     
     DATASET_NAME = "aslawliet/olympiads"
@@ -22,8 +24,7 @@ class OlympiadsDataset(BaseHFDataset):
             QAData object containing the formatted row data
         """
         # Extract problem statement and any additional fields
-        question = row.get('problem', '')
-        answer = row.get('solution', '')
+        question, answer = _get_fields(row)
         
         return QAData(
             key=self.get_key(index),
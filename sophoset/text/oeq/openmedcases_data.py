@@ -1,4 +1,4 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List
 
 from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
@@ -8,12 +8,20 @@ class OpenMedCasesDataset(BaseHFDataset):
     """A class to handle loading and managing the TruthfulQA dataset."""
     
     DATASET_NAME = "openmed-community/multicare-cases"
+    # batch_extract() reads the case texts from Arrow, so no column is decoded
+    BATCH_COLUMNS = []
 
     
     def __init__(self):
         """Initialize the dataset handler.
         """
         super().__init__(self.DATASET_NAME)
+        self._case_texts = None
+
+    def load_dataset(self, split_name: str, subset_name: str = 'default') -> None:
+        """Load a split and drop the case texts cached for the previous one."""
+        self._case_texts = None
+        super().load_dataset(split_name, subset_name)
     
     def extract_row_data(self, row: Dict[str, Any], index: int) -> QAData:
         """Extract and format data from a TruthfulQA dataset row.
@@ -25,19 +33,46 @@ class OpenMedCasesDataset(BaseHFDataset):
         Returns:
             QAData object containing the formatted row data
         """
-        # Extract question and best answer
-        cases = row.get('cases', [])
-        question = ""
-        if cases and isinstance(cases, list) and len(cases) > 0:
-            # Get the first case's text if available
-            first_case = cases[0]
-            question = first_case.get("case_text", "")
+        # Use the first case's text as the question
+        cases = row.get('cases')
+        question = (cases[0].get("case_text") or "") if cases else ""
         
         return QAData(
             key=self.get_key(index),
             question=question
         )
 
+    def batch_extract(self, batch: Dict[str, List[Any]], indices: List[int]) -> List[QAData]:
+        """Extract rows using the first-case texts read once from Arrow.
+
+        Args:
+            batch: Mapping of column name to the list of values in the batch (unused)
+            indices: The dataset indices of the rows in the batch
+
+        Returns:
+            List of QAData objects, one per row in the batch
+        """
+        if self._case_texts is None:
+            self._case_texts = self._first_case_texts()
+        texts = self._case_texts
+        return [QAData(key=self.get_key(index), question=texts[index]) for index in indices]
+
+    def _first_case_texts(self) -> List[str]:
+        """Read the text of the first case of every row of the loaded split.
+
+        Only the case_text field of the first element of the 'cases' list
+        column is converted to Python; rows without cases get an empty string.
+        The column is read through the Dataset rather than its raw Arrow table,
+        so an indices mapping from select, filter or shuffle is honoured.
+        """
+        import pyarrow.compute as pc
+
+        cases = self.dataset.select_columns(['cases']).with_format('arrow')[:].column('cases')
+        has_case = pc.fill_null(pc.greater(pc.list_value_length(cases), 0), False)
+        first_cases = pc.list_element(pc.filter(cases, has_case), 0)
+        texts = iter(pc.fill_null(pc.struct_field(first_cases, 'case_text'), '').to_pylist())
+        return [next(texts) if flag else '' for flag in has_case.to_pylist()]
+
 if __name__ == "__main__":
     dset = OpenMedCasesDataset()
     explorer = DatasetExplorer(dset)
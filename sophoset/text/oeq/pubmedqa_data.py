@@ -1,9 +1,11 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any
 
 from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
 from sophoset.utils.dataset_explorer import DatasetExplorer
 
+_get_fields = BaseHFDataset.field_getter('question', 'final_decision', 'long_answer')
+
 class PubMedQADataset(BaseHFDataset):
     """A class to handle loading and managing the PubMedQA dataset."""
     
@@ -25,9 +27,7 @@ class PubMedQADataset(BaseHFDataset):
             QAData object containing the formatted row data
         """
         # Extract question, context, and answer
-        question = row.get('question', '')
-        answer  = row.get('final_decision', '')
-        explanation  = row.get('long_answer', '')
+        question, answer, explanation = _get_fields(row)
         
         return QAData(
             key=self.get_key(index),
@@ -29,6 +29,8 @@ def process_arguments():
                       help='Model provider (e.g., openrouter, openai)')
     parser.add_argument("--temperature", type=float, default=0.7,
                       help='Sampling temperature for model generation')
+    parser.add_argument("-w", "--workers", type=int, default=4,
+                      help='Number of samples sent to the model concurrently')
     
     args = parser.parse_args()
     return args
@@ -54,7 +56,8 @@ def run_dataset():
     processor = DatasetProcessor(
         data_config=data_config,
         model_config=model_config,
-        update_existing=args.update
+        update_existing=args.update,
+        max_workers=args.workers
     )
     
     processor.process_dataset()
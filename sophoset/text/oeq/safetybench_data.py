@@ -1,9 +1,11 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any
 
 from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
 from sophoset.utils.dataset_explorer import DatasetExplorer
 
+_get_fields = BaseHFDataset.field_getter('question', 'category')
+
 class SafetyBenchDataset(BaseHFDataset):
     """A class to handle loading and managing the AIME 2025 dataset."""
     
@@ -25,8 +27,7 @@ class SafetyBenchDataset(BaseHFDataset):
             QAData object containing the formatted row data
         """
         # Extract question text
-        question = row.get('question', '')
-        answer = row.get('category', '')
+        question, answer = _get_fields(row)
         
         return QAData(
             key=self.get_key(index),
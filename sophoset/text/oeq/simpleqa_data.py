@@ -1,9 +1,11 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any
 
 from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
 from sophoset.utils.dataset_explorer import DatasetExplorer
 
+_get_fields = BaseHFDataset.field_getter('problem', 'answer')
+
 class SimpleQADataset(BaseHFDataset):
     """A class to handle loading and managing the MetaMathQA dataset."""
     
@@ -24,8 +26,7 @@ class SimpleQADataset(BaseHFDataset):
             QAData object containing the formatted row data
         """
         # Extract question and solution
-        question = row.get('problem', '')
-        answer = row.get('answer', '')
+        question, answer = _get_fields(row)
         
         return QAData(
             key=self.get_key(index),
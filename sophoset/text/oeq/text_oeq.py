@@ -1,10 +1,5 @@
 from any_llm import completion
 import os
-from pydantic import BaseModel
-from typing import List, Dict, Any
-import json
-from pathlib import Path
-from datetime import datetime
 
 class PromptGenerator:
     """
@@ -1,9 +1,11 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any
 
 from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
 from sophoset.utils.dataset_explorer import DatasetExplorer
 
+_get_fields = BaseHFDataset.field_getter('Question', 'Best Answer')
+
 class TruthfulQADataset(BaseHFDataset):
     """A class to handle loading and managing the TruthfulQA dataset."""
     
@@ -25,8 +27,7 @@ class TruthfulQADataset(BaseHFDataset):
             QAData object containing the formatted row data
         """
         # Extract question and best answer
-        question = row.get('Question', '')
-        answer = row.get('Best Answer', '')
+        question, answer = _get_fields(row)
         
         return QAData(
             key=self.get_key(index),
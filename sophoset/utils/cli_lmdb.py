@@ -8,13 +8,9 @@ import os
 import sys
 import argparse
 import json
-import pickle
-from PIL import Image
-import io
-import numpy as np
 from typing import Any, List, Dict, Optional
 
-from sophoset.utils.lmdb_storage import LMDBStorage, Config
+from sophoset.utils.lmdb_storage import LMDBStorage, Config, sniff_image_format
 
 class LMDBViewer:
     def __init__(self, db_path: str):
@@ -25,23 +21,30 @@ class LMDBViewer:
             sys.exit(1)
             
         try:
-            self.storage = LMDBStorage(Config(db_path=self.db_path))
+            # The browser walks the whole database, so start reading it in now
+            self.storage = LMDBStorage(Config(db_path=self.db_path, prewarm=True))
         except Exception as e:
             print(f"Error opening LMDB database: {e}")
             sys.exit(1)
     
     def get_all_keys(self) -> List[str]:
-        """Get all keys from the LMDB storage."""
+        """Get all keys from the LMDB storage, sorted.
+
+        LMDB already returns keys in byte order, which for UTF-8 is the same
+        as the order of the decoded strings, so no extra sort is needed.
+        """
         keys = []
         with self.storage.env.begin() as txn:
             cursor = txn.cursor()
-            for key, _ in cursor:
-                try:
-                    keys.append(key.decode('utf-8'))
-                except UnicodeDecodeError:
-                    # Handle non-UTF-8 keys
-                    keys.append(str(key))
-        return sorted(keys)
+            keys_append = keys.append
+            for key in cursor.iternext(keys=True, values=False):
+                # Keys are almost always ASCII, which decodes without UTF-8 validation
+                if key.isascii():
+                    keys_append(key.decode('ascii'))
+                    continue
+                # surrogateescape keeps non-UTF-8 keys in byte order as well
+                keys_append(key.decode('utf-8', errors='surrogateescape'))
+        return keys
     
     def get_value(self, key: str) -> Any:
         """Get a value from the LMDB storage by key."""
@@ -56,17 +59,23 @@ class LMDBViewer:
             return "None"
         
         if isinstance(value, bytes):
-            # Try to detect image data
-            try:
-                img = Image.open(io.BytesIO(value))
-                return f"[Image: {img.format}, size={img.size}, mode={img.mode}]"
-            except:
-                pass
+            # Only hand data with a known image signature to PIL
+            if sniff_image_format(value):
+                try:
+                    # PIL is only needed for image values, so import it here
+                    import io
+                    from PIL import Image
+                    img = Image.open(io.BytesIO(value))
+                    return f"[Image: {img.format}, size={img.size}, mode={img.mode}]"
+                except Exception:
+                    pass
             
             # Try to decode as text
+            if value.isascii():
+                return value.decode('ascii')
             try:
                 return value.decode('utf-8')
-            except:
+            except UnicodeDecodeError:
                 return f"[Binary data: {len(value)} bytes]"
         
         if isinstance(value, (str, int, float, bool)):
@@ -75,7 +84,9 @@ class LMDBViewer:
         if isinstance(value, (list, dict, tuple, set)):
             return json.dumps(value, indent=2, default=str)
             
-        if isinstance(value, np.ndarray):
+        # An unpickled array means numpy is already loaded; never import it here
+        np = sys.modules.get('numpy')
+        if np is not None and isinstance(value, np.ndarray):
             return f"Numpy array shape: {value.shape}\n{value}"
             
         return str(value)
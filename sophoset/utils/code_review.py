@@ -1,14 +1,45 @@
-import google.generativeai as genai
+import functools
+import hashlib
 import os
 import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # NOTE: The API key is assumed to be provided by the environment.
 # Do not hardcode your API key.
 API_KEY = os.environ.get("GOOGLE_API_KEY", "")
 
-# Configure the API key
-genai.configure(api_key=API_KEY)
+MODEL_NAME = 'gemini-2.5-flash-preview-05-20'
+
+SYSTEM_PROMPT = (
+    "You are a world-class Python code reviewer. Your task is to analyze "
+    "the provided Python code and provide a professional, constructive, and "
+    "detailed review based on the following criteria:\n"
+    "1. Are the imports in the correct order (e.g., standard library, third-party, local)?\n"
+    "2. Are the function names self-explanatory and simple? Suggest better names if needed.\n"
+    "3. Are there any redundant variables or functions? Identify and explain them.\n"
+    "4. Are the functions logically ordered? Suggest a better order if necessary.\n"
+    "5. Are the doc-strings concise and precise?\n"
+    "6. Do not modify the code.\n"
+    "Provide your review in a clear, easy-to-read format."
+)
+
+@functools.lru_cache(maxsize=None)
+def get_review_model():
+    """
+    Creates the review model once; it is reused for every file.
+
+    The Gemini SDK is imported and configured here, on first use, so that
+    collecting files or answering from the review cache never loads it.
+    """
+    import google.generativeai as genai
+
+    # Configure the API key
+    genai.configure(api_key=API_KEY)
+    return genai.GenerativeModel(
+        model_name=MODEL_NAME,
+        system_instruction=SYSTEM_PROMPT
+    )
 
 def review_code(code_to_review: str) -> str:
     """
@@ -24,29 +55,11 @@ def review_code(code_to_review: str) -> str:
     if not code_to_review.strip():
         return "Error: No code provided to review."
 
-    # Define the system prompt and user query
-    system_prompt = (
-        "You are a world-class Python code reviewer. Your task is to analyze "
-        "the provided Python code and provide a professional, constructive, and "
-        "detailed review based on the following criteria:\n"
-        "1. Are the imports in the correct order (e.g., standard library, third-party, local)?\n"
-        "2. Are the function names self-explanatory and simple? Suggest better names if needed.\n"
-        "3. Are there any redundant variables or functions? Identify and explain them.\n"
-        "4. Are the functions logically ordered? Suggest a better order if necessary.\n"
-        "5. Are the doc-strings concise and precise?\n"
-        "6. Do not modify the code.\n"
-        "Provide your review in a clear, easy-to-read format."
-    )
+    # Define the user query
     user_query = f"Review the following Python code:\n\n```python\n{code_to_review}\n```"
 
     try:
-        model = genai.GenerativeModel(
-            model_name='gemini-2.5-flash-preview-05-20',
-            system_instruction=system_prompt
-        )
-        
-        print("Attempting to call the Gemini API...")
-        response = model.generate_content(user_query)
+        response = get_review_model().generate_content(user_query)
         
         # Check if the response contains content
         if not response or not response.candidates:
@@ -86,15 +99,70 @@ def collect_python_codes(path: str) -> list[str]:
         if path.endswith(".py"):
             python_files.append(path)
     elif os.path.isdir(path):
-        for root, dirs, files in os.walk(path):
-            for file in files:
-                if file.endswith(".py"):
-                    python_files.append(os.path.join(root, file))
+        # Walk with scandir directly: entry types come from the directory
+        # listing and entry.path needs no join
+        pending_dirs = [path]
+        while pending_dirs:
+            with os.scandir(pending_dirs.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending_dirs.append(entry.path)
+                    elif entry.name.endswith(".py"):
+                        python_files.append(entry.path)
     return python_files
 
+def review_cache_key(code: str) -> str:
+    """Returns a hash identifying a review of this code with the current model and prompt."""
+    digest = hashlib.sha256()
+    for part in (MODEL_NAME, SYSTEM_PROMPT, code):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+def review_file(file_path: str, output_dir: str) -> str:
+    """
+    Reviews a single Python file and writes the review to the output directory.
+
+    Reviews are cached in '<output_dir>/.cache' by a hash of the code, model
+    and prompt, so unchanged files are not sent to the API again.
+
+    Args:
+        file_path (str): The Python file to review.
+        output_dir (str): Directory the review file is written to.
+
+    Returns:
+        str: The text to show the user for this file.
+    """
+    # Create a unique output filename for each reviewed file
+    file_name_without_ext = os.path.splitext(os.path.basename(file_path))[0]
+    output_file_name = f"review_{file_name_without_ext}.txt"
+    output_path = os.path.join(output_dir, output_file_name)
+
+    header = f"\n--- Code Review for {file_path} ---\n"
+
+    code = read_file_content(file_path)
+    if "Error" in code:
+        return f"{header}\n{code}"
+
+    cache_path = os.path.join(output_dir, '.cache', f"{review_cache_key(code)}.txt")
+    if os.path.isfile(cache_path):
+        review_result = read_file_content(cache_path)
+    else:
+        review_result = review_code(code)
+        if not review_result.startswith("Error"):
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as cache_file:
+                cache_file.write(review_result)
+
+    with open(output_path, 'w', encoding='utf-8') as output_file:
+        output_file.write(f"{header}{review_result}\n\n")
+    return f"{header}\n{review_result}"
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Review Python code using the Gemini API.")
     parser.add_argument("path", help="Path to a Python file or a directory containing Python files.")
+    parser.add_argument("-w", "--workers", type=int, default=8,
+                        help="Number of files reviewed concurrently.")
     
     args = parser.parse_args()
     path_to_review = args.path
@@ -111,25 +179,14 @@ if __name__ == "__main__":
                 output_dir = 'code_reviews'
                 os.makedirs(output_dir, exist_ok=True)
 
-                for file_path in python_files:
-                    # Create a unique output filename for each reviewed file
-                    file_name_without_ext = os.path.splitext(os.path.basename(file_path))[0]
-                    output_file_name = f"review_{file_name_without_ext}.txt"
-                    output_path = os.path.join(output_dir, output_file_name)
-
-                    header = f"\n--- Code Review for {file_path} ---\n"
-                    print(header)  # Print to console for user feedback
-
-                    code = read_file_content(file_path)
-                    if "Error" in code:
-                        print(code)
-                    else:
-                        review_result = review_code(code)
-                        print(review_result)  # Print to console for user feedback
-                        
-                        with open(output_path, 'w', encoding='utf-8') as output_file:
-                            output_file.write(header)
-                            output_file.write(review_result + "\n\n")
+                # API calls are network-bound, so review several files at once
+                with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+                    futures = [
+                        executor.submit(review_file, file_path, output_dir)
+                        for file_path in python_files
+                    ]
+                    for future in as_completed(futures):
+                        print(future.result())  # Print to console for user feedback
 
                 print(f"\nAll code reviews have been written to the '{output_dir}' directory.")
             except Exception as e:
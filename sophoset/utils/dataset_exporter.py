@@ -2,27 +2,121 @@
 Dataset Exporter Module
 
 This module provides functions for exporting a BaseHFDataset
-instance to various file formats, such as JSON and LMDB.
+instance to various file formats, such as JSON, LMDB and Arrow IPC.
 """
 
+import io
 import json
 import os
 import logging
-from dataclasses import asdict
+import multiprocessing
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import fields, replace
+from operator import attrgetter
 from tqdm import tqdm
-from typing import Any, Optional
+from typing import Any, Callable, Deque, Iterator, List, Optional, Union
 
 from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.lmdb_storage import LMDBStorage, Config
+from sophoset.utils.prefetch import prefetch
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the standard json module
+    orjson = None
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# QAData field names and a getter returning all of them in one call, so rows
+# can be turned into dicts without asdict()'s recursive deep copy
+_QADATA_FIELDS = tuple(f.name for f in fields(QAData))
+_get_qadata_values = attrgetter(*_QADATA_FIELDS)
+
+# Reusable encode buffers for _process_image_for_storage, one pool per thread
+# since images are encoded on the row prefetch thread pool
+_buffer_pools = threading.local()
+_BUFFER_POOL_SIZE = 32
+
+# JPEG start-of-image marker; RGB JPEG input is stored without re-encoding
+_JPEG_SOI = b'\xff\xd8\xff'
+
+# Larger RGB JPEGs are still re-encoded at quality 85, which usually shrinks
+# high-quality or multi-megapixel files instead of storing them as-is
+_MAX_PASSTHROUGH_BYTES = 1 << 20
+
+# Rows with images prepared concurrently, so downloads and JPEG encoding of
+# upcoming rows overlap with writing the current one
+_PREFETCH_WORKERS = 16
+
+# Shared HTTP session for image downloads, created lazily once per process
+_http_session = None
+_http_session_pid = None
+_http_session_lock = threading.Lock()
+
+# Dataset handed to each worker process of a parallel LMDB export
+_worker_dataset: Optional[BaseHFDataset] = None
+
+# Rows per record batch in Arrow exports
+_ARROW_BATCH_SIZE = 1024
+
+
+def _get_http_session():
+    """Return this process's pooled requests.Session for image downloads.
+
+    Reusing one session keeps connections (and their TLS handshakes) alive
+    across images. Sessions are not shared with forked export workers.
+    """
+    global _http_session, _http_session_pid
+    with _http_session_lock:
+        if _http_session is None or _http_session_pid != os.getpid():
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=_PREFETCH_WORKERS,
+                pool_maxsize=_PREFETCH_WORKERS,
+                max_retries=3
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _http_session = session
+            _http_session_pid = os.getpid()
+        return _http_session
+
+
+def _init_export_worker(dataset: BaseHFDataset) -> None:
+    """Store the loaded dataset in an export worker process."""
+    global _worker_dataset
+    _worker_dataset = dataset
+
+
+def _prepare_chunk(indices: List[int]) -> List[QAData]:
+    """Extract and prepare a chunk of rows for LMDB in an export worker process."""
+    return list(DatasetExporter._iter_prepared_rows(_worker_dataset, indices))
+
+
+def _extract_chunk(indices: List[int]) -> List[QAData]:
+    """Extract a chunk of rows in an export worker process."""
+    return list(_worker_dataset.iter_samples(indices))
+
+
+def _as_text(value: Any) -> Optional[str]:
+    """Return a QAData text field as a string, keeping None as a null."""
+    if value is None or isinstance(value, str):
+        return value
+    return str(value)
+
+
 class DatasetExporter:
     """A utility class for exporting BaseHFDataset objects to files."""
 
     @staticmethod
-    def save_to_json(dataset: BaseHFDataset, output_dir: str = 'datasets', indent: int = 4, ensure_ascii: bool = False) -> None:
+    def save_to_json(dataset: BaseHFDataset, output_dir: str = 'datasets', indent: int = 4, ensure_ascii: bool = False,
+                     num_workers: Optional[int] = 1) -> None:
         """
         Save the entire dataset to a single JSON file with nice formatting,
         writing incrementally. The filename is automatically generated.
@@ -32,6 +126,14 @@ class DatasetExporter:
             output_dir: Directory to save the JSON file.
             indent: Number of spaces for indentation (default: 4).
             ensure_ascii: If True, escape non-ASCII characters (default: False).
+            num_workers: Number of processes used to extract rows. Values
+                         above 1 use a multiprocessing pool; encoding and
+                         writing always happen in the calling process.
+                         None uses one process per CPU.
+            
+        Rows are encoded with orjson when it is installed and the requested
+        formatting allows it (indent of 0 or 2, ensure_ascii False), and with
+        the standard json module otherwise.
             
         Raises:
             ValueError: If dataset is None or invalid parameters
@@ -43,6 +145,10 @@ class DatasetExporter:
             raise ValueError("output_dir must be a string")
         if not isinstance(indent, int) or indent < 0:
             raise ValueError("indent must be a non-negative integer")
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        if not isinstance(num_workers, int) or num_workers < 1:
+            raise ValueError("num_workers must be a positive integer")
         # Get all available subsets
         subsets = dataset.get_subsets()
         if not subsets:
@@ -52,12 +158,17 @@ class DatasetExporter:
         dname = dataset.dataset_name.replace('/', '_')
         filename = os.path.join(output_dir, f"{dname}.json")
             
+        # orjson only indents by 2 spaces and always writes UTF-8
+        use_orjson = orjson is not None and indent in (0, 2) and not ensure_ascii
+        separator = b',\n' if indent > 0 else b','
+            
         total_rows = 0
         try:
-            with open(filename, 'w', encoding='utf-8') as file:
-                file.write('[')
+            # Rows are small writes; a large buffer turns them into few syscalls
+            with open(filename, 'wb', buffering=1 << 20) as file:
+                file.write(b'[')
                 if indent > 0:
-                    file.write('\n')
+                    file.write(b'\n')
                 first_item = True
                 
                 for subset in subsets:
@@ -70,46 +181,78 @@ class DatasetExporter:
                             continue
                             
                         nrows = dataset.get_row_count()
+                        if num_workers > 1:
+                            rows = DatasetExporter._iter_pooled_rows(dataset, num_workers, _extract_chunk)
+                        else:
+                            rows = dataset.iter_samples()
+                        # Extract the next rows while this thread encodes and writes
+                        rows = prefetch(rows, name=f"export-{subset}-{split}")
                         
-                        for irow in tqdm(range(nrows), desc=f"{subset}-{split}"):
+                        for row in DatasetExporter._progress(rows, nrows, f"{subset}-{split}"):
+                            if DatasetExporter._is_empty_row(row):
+                                logger.debug(f"Skipping empty row {row.key}")
+                                continue
                             try:
-                                row = dataset.get_row_data(irow)
-                                row_dict = asdict(row)
+                                # Encode first so a failed row leaves no stray separator
+                                if use_orjson:
+                                    data = orjson.dumps(
+                                        row,
+                                        option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+                                    )
+                                else:
+                                    # Shallow dict; json.dumps reads the nested values in place
+                                    row_dict = dict(zip(_QADATA_FIELDS, _get_qadata_values(row)))
+                                    data = json.dumps(
+                                        row_dict,
+                                        ensure_ascii=ensure_ascii,
+                                        indent=indent if indent > 0 else None
+                                    ).encode('utf-8')
                                 
                                 if not first_item:
-                                    file.write(',')
-                                    if indent > 0:
-                                        file.write('\n')
+                                    file.write(separator)
                                 else:
                                     first_item = False
                                 
-                                json.dump(
-                                    row_dict,
-                                    file,
-                                    ensure_ascii=ensure_ascii,
-                                    indent=indent if indent > 0 else None
-                                )
+                                file.write(data)
                                 total_rows += 1
                             except Exception as e:
-                                logger.error(f"Error processing row {irow} in {subset}-{split}: {e}")
+                                logger.error(f"Error processing row {row.key} in {subset}-{split}: {e}")
                                 continue
                 
                 if total_rows > 0 and indent > 0:
-                    file.write('\n')
-                file.write(']')
+                    file.write(b'\n')
+                file.write(b']')
         except IOError as e:
             logger.error(f"Error writing to file {filename}: {e}")
             raise
             
         logger.info(f"Saved {total_rows} rows to {filename}")
 
+    @staticmethod
+    def _progress(rows: Iterator[QAData], total: int, desc: str) -> Iterator[QAData]:
+        """
+        Wraps an export loop in a progress bar that redraws rarely.
+        
+        Per-row export work can take microseconds, so the bar only checks
+        whether to redraw every ~0.2% of the rows and at most twice a second.
+        """
+        return tqdm(
+            rows,
+            total=total,
+            desc=desc,
+            miniters=max(1, total // 500),
+            mininterval=0.5,
+            smoothing=0
+        )
+
     @staticmethod
     def _process_image_for_storage(image_data: Any) -> Optional[bytes]:
         """
         Process image data for storage in LMDB.
         
         Args:
-            image_data: Can be a file path (str), URL (str), PIL Image, or bytes
+            image_data: Can be a file path (str), URL (str), PIL Image, bytes, or
+                        an undecoded Hugging Face image dict ('bytes', 'path')
             
         Returns:
             bytes: Serialized image data in JPEG format, or None if processing fails
@@ -120,30 +263,38 @@ class DatasetExporter:
             requests.RequestException: If URL download fails
         """
         from PIL import Image
-        import io
         
         if image_data is None:
             return None
             
         try:
+            if isinstance(image_data, dict):
+                # Undecoded Hugging Face image; prefer the embedded bytes
+                image_data = image_data.get('bytes') or image_data.get('path')
+                if image_data is None:
+                    return None
             if isinstance(image_data, str):
                 # Handle file path or URL
                 if image_data.startswith(('http://', 'https://')):
                     # Download image from URL
                     import requests
                     try:
-                        response = requests.get(image_data, timeout=10)
+                        response = _get_http_session().get(image_data, timeout=10)
                         response.raise_for_status()
-                        img = Image.open(io.BytesIO(response.content))
                     except requests.RequestException as e:
                         logger.error(f"Failed to download image from URL {image_data}: {e}")
                         return None
+                    return DatasetExporter._encode_image_bytes(response.content)
                 else:
                     # Handle local file path
                     if not os.path.exists(image_data):
                         logger.error(f"Image file not found: {image_data}")
                         return None
-                    img = Image.open(image_data)
+                    with open(image_data, 'rb') as f:
+                        return DatasetExporter._encode_image_bytes(f.read())
+            elif isinstance(image_data, (bytes, bytearray, memoryview)):
+                # Handle encoded image bytes
+                return DatasetExporter._encode_image_bytes(bytes(image_data))
             elif hasattr(image_data, 'read') and callable(image_data.read):
                 # Handle file-like objects
                 img = Image.open(image_data)
@@ -154,21 +305,173 @@ class DatasetExporter:
                 logger.error(f"Unsupported image data type: {type(image_data)}")
                 return None
                 
-            # Convert to RGB if needed
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
-                
-            # Save to bytes buffer
-            buffered = io.BytesIO()
-            img.save(buffered, format='JPEG', quality=85)  # Add quality parameter
-            return buffered.getvalue()
+            return DatasetExporter._encode_jpeg(img)
             
         except Exception as e:
             logger.error(f"Error processing image: {e}")
             return None
 
     @staticmethod
-    def save_to_lmdb(dataset: BaseHFDataset, output_dir: str = 'datasets') -> None:
+    def _encode_image_bytes(data: bytes) -> bytes:
+        """
+        Returns encoded image bytes as RGB JPEG bytes.
+        
+        Data that already is an RGB JPEG of at most _MAX_PASSTHROUGH_BYTES is
+        returned unchanged; opening it only reads the header, so such images
+        are neither decoded nor re-encoded. Anything else is decoded and
+        re-encoded.
+        """
+        from PIL import Image
+        
+        img = Image.open(io.BytesIO(data))
+        if (len(data) <= _MAX_PASSTHROUGH_BYTES and data[:3] == _JPEG_SOI
+                and img.format == 'JPEG' and img.mode == 'RGB'):
+            return data
+        return DatasetExporter._encode_jpeg(img)
+
+    @staticmethod
+    def _encode_jpeg(img: Any) -> bytes:
+        """Encodes a PIL image as RGB JPEG bytes (quality 85)."""
+        # Convert to RGB if needed
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+            
+        # Save to a buffer from this thread's pool, emptied and returned after use
+        pool = getattr(_buffer_pools, 'pool', None)
+        if pool is None:
+            pool = _buffer_pools.pool = []
+        buffered = pool.pop() if pool else io.BytesIO()
+        try:
+            img.save(buffered, format='JPEG', quality=85)  # Add quality parameter
+            return buffered.getvalue()
+        finally:
+            buffered.seek(0)
+            buffered.truncate(0)
+            if len(pool) < _BUFFER_POOL_SIZE:
+                pool.append(buffered)
+
+    @staticmethod
+    def _prepare_for_lmdb(row_data: QAData) -> QAData:
+        """
+        Returns the row with its images converted to JPEG bytes.
+        
+        Rows without images are already ready to store and are returned as-is.
+        Rows with images get a shallow copy holding the converted images, so
+        the original row is left untouched without copying its other fields.
+        
+        Args:
+            row_data: The extracted row
+            
+        Returns:
+            QAData: The row ready to be stored in LMDB
+        """
+        if not getattr(row_data, 'images', None):
+            return row_data
+        
+        processed_images = []
+        for img in row_data.images:
+            if img:  # Only process non-None images
+                processed_img = DatasetExporter._process_image_for_storage(img)
+                if processed_img is not None:
+                    processed_images.append(processed_img)
+        # Replace the original images with processed byte data
+        return replace(row_data, images=processed_images)
+
+    @staticmethod
+    def _is_empty_row(row_data: QAData) -> bool:
+        """
+        Checks whether a row has neither question text nor images.
+        
+        Such rows usually come from a missing source column and cannot be
+        evaluated, so the exporters skip them instead of writing them out.
+        """
+        return not row_data.question and not row_data.images
+
+    @staticmethod
+    def _iter_prepared_rows(dataset: BaseHFDataset, indices: Optional[List[int]] = None) -> Iterator[QAData]:
+        """
+        Extracts rows of the loaded split and prepares them for LMDB, skipping
+        rows that fail or are empty.
+        
+        Rows with images are prepared on a thread pool, up to a window of
+        rows ahead of the consumer, so image downloads and encoding overlap.
+        Rows are still yielded in order. The image helpers therefore must only
+        share thread-safe state: the HTTP session is created under a lock and
+        encode buffers are pooled per thread.
+        """
+        pending: Deque[Union[QAData, Future]] = deque()
+        keys: Deque[str] = deque()
+        
+        def next_ready() -> Optional[QAData]:
+            item, key = pending.popleft(), keys.popleft()
+            if not isinstance(item, Future):
+                return item
+            try:
+                return item.result()
+            except Exception as e:
+                logger.error(f"Error processing row {key}: {e}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=_PREFETCH_WORKERS) as executor:
+            for row_data in dataset.iter_samples(indices):
+                if DatasetExporter._is_empty_row(row_data):
+                    logger.debug(f"Skipping empty row {row_data.key}")
+                    continue
+                if row_data.images:
+                    pending.append(executor.submit(DatasetExporter._prepare_for_lmdb, row_data))
+                else:
+                    # Nothing to convert, so skip the pool round trip
+                    pending.append(row_data)
+                keys.append(row_data.key)
+                
+                if len(pending) > 2 * _PREFETCH_WORKERS:
+                    row = next_ready()
+                    if row is not None:
+                        yield row
+            
+            while pending:
+                row = next_ready()
+                if row is not None:
+                    yield row
+
+    @staticmethod
+    def _iter_lmdb_rows(dataset: BaseHFDataset, num_workers: int) -> Iterator[QAData]:
+        """
+        Yields the prepared rows of the loaded split in index order.
+        
+        With more than one worker, row extraction and image encoding run in a
+        process pool over chunks of BATCH_SIZE rows, while the caller keeps
+        writing to LMDB in this process.
+        """
+        if num_workers <= 1:
+            yield from DatasetExporter._iter_prepared_rows(dataset)
+            return
+        yield from DatasetExporter._iter_pooled_rows(dataset, num_workers, _prepare_chunk)
+
+    @staticmethod
+    def _iter_pooled_rows(dataset: BaseHFDataset, num_workers: int,
+                          process_chunk: Callable[[List[int]], List[QAData]]) -> Iterator[QAData]:
+        """
+        Yields the rows of the loaded split produced by a process pool.
+        
+        The split is cut into chunks of BATCH_SIZE indices and each chunk is
+        handed to process_chunk in a worker that holds its own copy of the
+        dataset. Chunks come back in index order.
+        """
+        nrows = dataset.get_row_count()
+        chunk_size = dataset.BATCH_SIZE
+        chunks = [
+            list(range(start, min(start + chunk_size, nrows)))
+            for start in range(0, nrows, chunk_size)
+        ]
+        with multiprocessing.Pool(num_workers, initializer=_init_export_worker, initargs=(dataset,)) as pool:
+            # imap keeps chunk order so keys are written in index order
+            for rows in pool.imap(process_chunk, chunks):
+                yield from rows
+
+    @staticmethod
+    def save_to_lmdb(dataset: BaseHFDataset, output_dir: str = 'datasets', num_workers: Optional[int] = 1,
+                     serializer: str = 'pickle') -> None:
         """
         Saves the entire dataset to an LMDB database.
         
@@ -179,6 +482,14 @@ class DatasetExporter:
         Args:
             dataset: The dataset to export
             output_dir: The directory to save the LMDB database.
+            num_workers: Number of processes used to extract and prepare rows.
+                         Values above 1 use a multiprocessing pool; writes
+                         always happen in the calling process.
+                         None uses one process per CPU.
+            serializer: Value encoding passed to LMDBStorage. 'pickle' (default)
+                        stores QAData objects; 'json' stores them as JSON
+                        objects, which is faster and smaller for text-only
+                        datasets but cannot hold image bytes.
             
         Raises:
             ValueError: If dataset is None or invalid parameters
@@ -188,12 +499,31 @@ class DatasetExporter:
             raise ValueError("Dataset cannot be None")
         if not isinstance(output_dir, str):
             raise ValueError("output_dir must be a string")
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        if not isinstance(num_workers, int) or num_workers < 1:
+            raise ValueError("num_workers must be a positive integer")
         dname = dataset.dataset_name.replace('/', '_') if hasattr(dataset, 'dataset_name') else 'dataset'
         db_path = os.path.join(output_dir, f"{dname}_lmdb")
         
+        # Images are stored as JPEG bytes, so keep them encoded while loading;
+        # JPEGs then pass through without being decoded at all
+        decode_images = getattr(dataset, 'decode_images', True)
+        dataset.decode_images = False
+        
         # Use the LMDBStorage context manager to ensure the connection is closed
         try:
-            with LMDBStorage(config=Config(db_path=db_path)) as storage:
+            # A fresh export can be rebuilt from the source dataset, so skip the
+            # per-commit fsyncs; closing the storage flushes everything once.
+            # writemap is left off: it would extend data.mdb to the whole map
+            # size, and exported databases are copied and shared.
+            config = Config(
+                db_path=db_path,
+                serializer=serializer,
+                sync=False,
+                metasync=False
+            )
+            with LMDBStorage(config=config) as storage:
                 total_rows = 0
                 subsets = dataset.get_subsets()
                 
@@ -203,35 +533,19 @@ class DatasetExporter:
                         try:
                             dataset.load_dataset(split, subset)
                             nrows = dataset.get_row_count()
+                            # Extract and prepare the next rows while this
+                            # thread serializes and writes to LMDB
+                            rows = prefetch(
+                                DatasetExporter._iter_lmdb_rows(dataset, num_workers),
+                                name=f"export-{subset}-{split}"
+                            )
                             
-                            for irow in tqdm(range(nrows), desc=f"{subset}-{split}"):
-                                try:
-                                    row_data = dataset.get_row_data(irow)
-                                    
-                                    # Create a copy to avoid modifying the original
-                                    from copy import deepcopy
-                                    row_data_copy = deepcopy(row_data)
-                                    
-                                    # Process images if they exist
-                                    if hasattr(row_data_copy, 'images') and row_data_copy.images:
-                                        processed_images = []
-                                        for img in row_data_copy.images:
-                                            if img:  # Only process non-None images
-                                                processed_img = DatasetExporter._process_image_for_storage(img)
-                                                if processed_img is not None:
-                                                    processed_images.append(processed_img)
-                                        # Replace the original images with processed byte data
-                                        row_data_copy.images = processed_images
-                                    
-                                    # Generate a unique key for the LMDB entry
-                                    key = dataset.get_key(irow)
-                                    
-                                    # Put the QAData object into the LMDB database
-                                    storage.put(key, row_data_copy)
-                                    total_rows += 1
-                                except Exception as e:
-                                    logger.error(f"Error processing row {irow} in {subset}-{split}: {e}")
-                                    continue
+                            # Write the QAData objects in large transactions
+                            # rather than committing every row
+                            total_rows += storage.put_many(
+                                (row_data.key, row_data)
+                                for row_data in DatasetExporter._progress(rows, nrows, f"{subset}-{split}")
+                            )
                                 
                         except Exception as e:
                             logger.error(f"Error processing subset '{subset}', split '{split}': {e}")
@@ -242,6 +556,126 @@ class DatasetExporter:
         except Exception as e:
             logger.error(f"An error occurred while saving to LMDB: {str(e)}")
             raise
+        finally:
+            dataset.decode_images = decode_images
+
+    @staticmethod
+    def save_to_arrow(dataset: BaseHFDataset, output_dir: str = 'datasets', num_workers: Optional[int] = 1,
+                      batch_size: int = _ARROW_BATCH_SIZE) -> None:
+        """
+        Saves the entire dataset to a single Arrow IPC file.
+        
+        Rows are prepared as for LMDB, so images are stored as JPEG bytes, and
+        written in record batches of one column per QAData field. Options are
+        stored as a string-to-string map and metadata as a JSON string. The
+        file can be memory-mapped with pyarrow.memory_map() and read back
+        column-wise by pyarrow.ipc.open_file() or pandas.read_feather().
+
+        Args:
+            dataset: The dataset to export
+            output_dir: Directory to save the Arrow file.
+            num_workers: Number of processes used to extract and prepare rows.
+                         Values above 1 use a multiprocessing pool; writes
+                         always happen in the calling process.
+                         None uses one process per CPU.
+            batch_size: Number of rows per record batch.
+            
+        Raises:
+            ValueError: If dataset is None or invalid parameters
+            IOError: If file writing fails
+        """
+        import pyarrow as pa
+        
+        if dataset is None:
+            raise ValueError("Dataset cannot be None")
+        if not isinstance(output_dir, str):
+            raise ValueError("output_dir must be a string")
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        if not isinstance(num_workers, int) or num_workers < 1:
+            raise ValueError("num_workers must be a positive integer")
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        
+        os.makedirs(output_dir, exist_ok=True)
+        dname = dataset.dataset_name.replace('/', '_')
+        filename = os.path.join(output_dir, f"{dname}.arrow")
+        schema = pa.schema([
+            ('key', pa.string()),
+            ('context', pa.string()),
+            ('question', pa.string()),
+            ('images', pa.list_(pa.large_binary())),
+            ('options', pa.map_(pa.string(), pa.string())),
+            ('answer', pa.string()),
+            ('explanation', pa.string()),
+            ('metadata', pa.string()),
+        ])
+        
+        # Images are stored as JPEG bytes, so keep them encoded while loading
+        decode_images = getattr(dataset, 'decode_images', True)
+        dataset.decode_images = False
+        
+        total_rows = 0
+        try:
+            with pa.OSFile(filename, 'wb') as sink, pa.ipc.new_file(sink, schema) as writer:
+                for subset in dataset.get_subsets() or ['default']:
+                    for split in dataset.get_splits(subset):
+                        try:
+                            dataset.load_dataset(split, subset)
+                            nrows = dataset.get_row_count()
+                            # Extract and prepare the next rows while this
+                            # thread converts and writes record batches
+                            rows = prefetch(
+                                DatasetExporter._iter_lmdb_rows(dataset, num_workers),
+                                name=f"export-{subset}-{split}"
+                            )
+                            
+                            batch: List[QAData] = []
+                            for row in DatasetExporter._progress(rows, nrows, f"{subset}-{split}"):
+                                batch.append(row)
+                                if len(batch) >= batch_size:
+                                    writer.write_batch(DatasetExporter._to_record_batch(batch, schema))
+                                    total_rows += len(batch)
+                                    batch = []
+                            if batch:
+                                writer.write_batch(DatasetExporter._to_record_batch(batch, schema))
+                                total_rows += len(batch)
+                                
+                        except Exception as e:
+                            logger.error(f"Error processing subset '{subset}', split '{split}': {e}")
+                            continue
+        except IOError as e:
+            logger.error(f"Error writing to file {filename}: {e}")
+            raise
+        finally:
+            dataset.decode_images = decode_images
+            
+        logger.info(f"Saved {total_rows} rows to {filename}")
+
+    @staticmethod
+    def _to_record_batch(rows: List[QAData], schema: Any) -> Any:
+        """
+        Converts prepared rows to an Arrow record batch with the given schema.
+        
+        Text fields that hold other values, such as numeric answers, are
+        stored as their string form.
+        """
+        import pyarrow as pa
+        
+        columns = {
+            'key': [row.key for row in rows],
+            'context': [_as_text(row.context) for row in rows],
+            'question': [_as_text(row.question) for row in rows],
+            'images': [row.images or [] for row in rows],
+            'options': [
+                [(str(letter), _as_text(option)) for letter, option in (row.options or {}).items()]
+                for row in rows
+            ],
+            'answer': [_as_text(row.answer) for row in rows],
+            'explanation': [_as_text(row.explanation) for row in rows],
+            'metadata': [json.dumps(row.metadata, default=str) if row.metadata else '' for row in rows],
+        }
+        return pa.RecordBatch.from_pydict(columns, schema=schema)
 
     @staticmethod
     def save(dataset: BaseHFDataset, format: str = 'lmdb', output_dir: str = 'datasets', **kwargs) -> None:
@@ -250,7 +684,7 @@ class DatasetExporter:
         
         Args:
             dataset: The dataset to export
-            format: The output format ('json' or 'lmdb')
+            format: The output format ('json', 'lmdb' or 'arrow')
             output_dir: Directory to save the output files
             **kwargs: Additional arguments to pass to the specific save method
             
@@ -267,5 +701,7 @@ class DatasetExporter:
             return DatasetExporter.save_to_json(dataset, output_dir=output_dir, **kwargs)
         elif format == 'lmdb':
             return DatasetExporter.save_to_lmdb(dataset, output_dir=output_dir, **kwargs)
+        elif format == 'arrow':
+            return DatasetExporter.save_to_arrow(dataset, output_dir=output_dir, **kwargs)
         else:
-            raise ValueError(f"Unsupported format: {format}. Must be 'json' or 'lmdb'.")
+            raise ValueError(f"Unsupported format: {format}. Must be 'json', 'lmdb' or 'arrow'.")
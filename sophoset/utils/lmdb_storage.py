@@ -1,11 +1,34 @@
 import os
 import json
+import functools
 import zlib
 import pickle
+import pickletools
 import lmdb
 import logging
-from dataclasses import dataclass
-from typing import Any, Dict, Optional, Union, TypeVar, Type, List
+import threading
+from dataclasses import asdict, dataclass, is_dataclass
+from typing import Any, Dict, Iterable, Iterator, Optional, Union, TypeVar, Type, List, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the standard json module
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # optional, only needed for compression="zstd"
+    zstandard = None
+
+try:
+    import msgspec
+except ImportError:  # optional, only needed for serializer="msgpack"
+    msgspec = None
+
+try:
+    import ijson
+except ImportError:  # optional, from_json falls back to json.load
+    ijson = None
 
 # Note: datasets import removed as it's not used in this module
 
@@ -26,16 +49,117 @@ class Config:
     Attributes:
         db_path (str): Path to the LMDB environment directory. This is where the
                        database files will be stored.
-        compress (bool): If True, stored values will be compressed using zlib.
+        compress (bool): If True, stored values will be compressed.
                          This is useful for reducing disk space, especially
                          for text-heavy data.
-        compression_level (int): The zlib compression level, from 0 to 9. A level
-                                 of 9 provides maximum compression but is slower,
-                                 while a lower number is faster with less compression.
+        compression (str): The compressor used for new values, "zlib" (default)
+                           or "zstd" (requires the zstandard package; several
+                           times faster at similar ratios). Reads detect the
+                           format of each value, so databases may mix both.
+        compression_level (int): The compression level: 0 to 9 for zlib, 1 to 22
+                                 for zstd. Higher levels compress more but are
+                                 slower.
+        serializer (str): Value encoding: "pickle" (any Python object), "json"
+                          (JSON-compatible values and Pydantic models, encoded
+                          with orjson when it is installed) or "msgpack"
+                          (dataclasses such as QAData and Pydantic models,
+                          encoded with msgspec; much faster than pickle and
+                          json for records). Values are read back as dicts
+                          unless `get` is given a `type_hint`.
+        map_size (int): Maximum size of the memory map in bytes. LMDB's own
+                        default is only 10 MiB; reserving a large map up front
+                        avoids MapFullError and resizes during bulk writes.
+                        Without writemap, the file only grows as data is
+                        written on most platforms.
+        writemap (bool): If True, write directly to the memory map instead of
+                         copying pages through malloc'd buffers. LMDB then
+                         extends data.mdb to the full map_size when it is
+                         opened, so a sparse file of that size is created
+                         even for a small database.
+        map_async (bool): With writemap, flush the map asynchronously.
+        sync (bool): If False, do not fsync on every commit. Data is flushed
+                     when the storage is closed; an OS crash may lose the
+                     most recent transactions.
+        metasync (bool): If False, do not fsync the meta page on commit.
+        optimize_pickles (bool): If True, strip unused memo opcodes from pickles
+                                 of up to 16 KiB with pickletools.optimize.
+                                 This shrinks small records by a few percent
+                                 at the cost of a pure-Python pass per value.
+        readahead (bool): If False, disable OS readahead on the map. This helps
+                          random reads when the database is larger than RAM.
+        prewarm (bool): If True, load the database file into the OS page cache
+                        on open, so browsing a fresh database does not stall on
+                        cold page faults. See `LMDBStorage.prewarm`.
+
+        For one-shot bulk loads that can be rebuilt from the source dataset,
+        sync=False and metasync=False give several times higher write
+        throughput; the data is flushed once when the load finishes. Add
+        writemap=True only for databases that are not copied or distributed,
+        since it preallocates the whole map in data.mdb.
     """
     db_path: str = "lmdb_data"
     compress: bool = True
+    compression: str = "zlib"
     compression_level: int = 6
+    serializer: str = "pickle"
+    optimize_pickles: bool = False
+    map_size: int = 16 << 30
+    writemap: bool = False
+    map_async: bool = False
+    sync: bool = True
+    metasync: bool = True
+    readahead: bool = True
+    prewarm: bool = False
+
+SERIALIZERS = ("pickle", "json", "msgpack")
+# Pinned rather than HIGHEST_PROTOCOL so every supported Python writes the same format
+PICKLE_PROTOCOL = 5
+# Larger pickles are not optimized; the pass costs more than it saves
+_OPTIMIZE_MAX_SIZE = 16 << 10
+COMPRESSIONS = ("zlib", "zstd")
+
+# Every zstd frame starts with this magic number; zlib streams never do
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+# Pickles (protocol 2+) start with the PROTO opcode; no zlib or zstd stream does
+_PICKLE_PROTO = 0x80
+# Pickles shorter than this are stored uncompressed; zlib/zstd framing
+# overhead makes them larger, not smaller
+_MIN_COMPRESS_SIZE = 128
+# Image formats that are already compressed and gain nothing from zlib/zstd
+_COMPRESSED_IMAGE_SIGNATURES = (b'\xff\xd8\xff', b'\x89PNG\r\n\x1a\n', b'GIF8', b'RIFF')
+# Leading bytes of the image formats the database viewers recognize
+_IMAGE_SIGNATURES = (
+    (b'\xff\xd8\xff', 'JPEG'),
+    (b'\x89PNG\r\n\x1a\n', 'PNG'),
+    (b'GIF87a', 'GIF'),
+    (b'GIF89a', 'GIF'),
+    (b'BM', 'BMP'),
+)
+
+def sniff_image_format(data: bytes) -> Optional[str]:
+    """Return the image format indicated by the leading bytes, or None."""
+    for signature, image_format in _IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return image_format
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return 'WEBP'
+    return None
+
+@functools.lru_cache(maxsize=1 << 16)
+def _encode_key(key: str) -> bytes:
+    """Encodes a key for LMDB, caching keys that are looked up repeatedly."""
+    return key.encode('utf-8')
+
+def _msgpack_enc_hook(value: Any) -> Any:
+    """Dumps Pydantic models to dicts, which msgspec cannot encode directly."""
+    if hasattr(value, 'model_dump'):
+        return value.model_dump()
+    raise NotImplementedError(f"Objects of type {type(value).__name__} are not supported")
+
+@functools.lru_cache(maxsize=None)
+def _msgpack_decoder(type_hint: Any = Any) -> Any:
+    """Returns a msgpack decoder for the given type, creating it on first use."""
+    return msgspec.msgpack.Decoder(type_hint)
 
 class LMDBStorage:
     """
@@ -66,12 +190,30 @@ class LMDBStorage:
             raise ValueError("Config cannot be None")
         if not isinstance(config, Config):
             raise ValueError("Config must be an instance of Config class")
+        if config.serializer not in SERIALIZERS:
+            raise ValueError(f"serializer must be one of {SERIALIZERS}, got '{config.serializer}'")
+        if config.serializer == "msgpack" and msgspec is None:
+            raise ValueError("serializer='msgpack' requires the msgspec package")
+        if config.compression not in COMPRESSIONS:
+            raise ValueError(f"compression must be one of {COMPRESSIONS}, got '{config.compression}'")
+        if config.compression == "zstd" and zstandard is None:
+            raise ValueError("compression='zstd' requires the zstandard package")
             
         self.config = config
         self.db_path = config.db_path
         self.compress = config.compress
-        # Ensure compression level is within valid range [0-9]
-        self.compression_level = min(9, max(0, config.compression_level))
+        self.serializer = config.serializer
+        self.compression = config.compression
+        # Ensure compression level is within the compressor's valid range
+        if self.compression == "zstd":
+            self.compression_level = min(22, max(1, config.compression_level))
+        else:
+            self.compression_level = min(9, max(0, config.compression_level))
+        # zstd (de)compressor objects are not thread-safe, so keep one per thread
+        self._zstd = threading.local()
+        self._msgpack_encoder = (
+            msgspec.msgpack.Encoder(enc_hook=_msgpack_enc_hook) if self.serializer == "msgpack" else None
+        )
         self.env: Optional[lmdb.Environment] = None
         self._setup_db(self.config)
     
@@ -92,9 +234,20 @@ class LMDBStorage:
             # Create the directory if it doesn't exist
             os.makedirs(config.db_path, exist_ok=True)
             # lmdb.open() creates the environment if it doesn't exist.
-            self.env = lmdb.open(config.db_path, max_dbs=1)
+            self.env = lmdb.open(
+                config.db_path,
+                max_dbs=1,
+                map_size=config.map_size,
+                writemap=config.writemap,
+                map_async=config.map_async,
+                sync=config.sync,
+                metasync=config.metasync,
+                readahead=config.readahead,
+            )
             # Open the main database handle
             self.db = self.env.open_db()
+            if config.prewarm:
+                self.prewarm()
         except Exception as e:
             raise RuntimeError(f"Failed to initialize LMDB: {str(e)}")
             
@@ -103,7 +256,9 @@ class LMDBStorage:
         Serializes a Python object to bytes using pickle with optional compression.
         
         This method uses the `pickle` module, which can serialize nearly any
-        Python object, making this storage solution highly flexible.
+        Python object, making this storage solution highly flexible. When the
+        storage is configured with `serializer="json"`, values are encoded as
+        JSON instead.
 
         Args:
             value (Any): The Python object to serialize.
@@ -115,19 +270,66 @@ class LMDBStorage:
         Raises:
             pickle.PicklingError: If the object cannot be pickled.
         """
-        try:
-            # Use pickle for robust serialization of any Python object
-            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
-        except pickle.PicklingError as e:
-            logger.error(f"Error pickling object: {e}")
-            raise
+        if self.serializer == "json":
+            data = self._to_json(value)
+        elif self.serializer == "msgpack":
+            data = self._msgpack_encoder.encode(value)
+        else:
+            try:
+                # Use pickle for robust serialization of any Python object
+                data = pickle.dumps(value, protocol=PICKLE_PROTOCOL)
+                if self.config.optimize_pickles and len(data) <= _OPTIMIZE_MAX_SIZE:
+                    data = pickletools.optimize(data)
+            except pickle.PicklingError as e:
+                logger.error(f"Error pickling object: {e}")
+                raise
         
-        # Apply compression if enabled
-        if self.compress:
+        # Apply compression if enabled, except for small pickles and pickles
+        # made up mostly of already-compressed image bytes; those are stored
+        # as-is and recognised on read by their PROTO opcode
+        if self.compress and not (
+            self.serializer == "pickle"
+            and (len(data) < _MIN_COMPRESS_SIZE or self._is_mostly_images(value, data))
+        ):
+            if self.compression == "zstd":
+                return self._zstd_compressor().compress(data)
             return zlib.compress(data, level=self.compression_level)
         return data
+
+    @staticmethod
+    def _is_mostly_images(value: Any, data: bytes) -> bool:
+        """Returns True if compressed image bytes make up most of the serialized value."""
+        images = getattr(value, 'images', None)
+        if not images or not isinstance(images, (list, tuple)):
+            return False
+        image_size = sum(
+            len(image) for image in images
+            if isinstance(image, (bytes, bytearray)) and image.startswith(_COMPRESSED_IMAGE_SIGNATURES)
+        )
+        return image_size * 2 > len(data)
+
+    def _zstd_compressor(self) -> Any:
+        """Returns this thread's zstd compressor."""
+        compressor = getattr(self._zstd, 'compressor', None)
+        if compressor is None:
+            compressor = self._zstd.compressor = zstandard.ZstdCompressor(level=self.compression_level)
+        return compressor
+
+    def _decompress(self, data: bytes) -> bytes:
+        """Decompresses a value written with either zlib or zstd."""
+        if data[:4] == _ZSTD_MAGIC:
+            if zstandard is None:
+                raise ValueError("value is zstd-compressed but the zstandard package is not installed")
+            decompressor = getattr(self._zstd, 'decompressor', None)
+            if decompressor is None:
+                decompressor = self._zstd.decompressor = zstandard.ZstdDecompressor()
+            try:
+                return decompressor.decompress(data)
+            except zstandard.ZstdError as e:
+                raise ValueError(f"invalid zstd value: {e}") from e
+        return zlib.decompress(data)
         
-    def _deserialize(self, data: bytes) -> Any:
+    def _deserialize(self, data: bytes, type_hint: Any = None) -> Any:
         """
         Deserializes bytes back to the original Python object, with optional decompression.
         
@@ -135,7 +337,10 @@ class LMDBStorage:
         and uses `pickle` to reconstruct the original Python object from bytes.
 
         Args:
-            data (bytes): The byte data to deserialize.
+            data (bytes): The byte data to deserialize. Any bytes-like object
+                          is accepted, including memoryviews from the map.
+            type_hint (Any, optional): Type to decode msgpack values into, e.g.
+                                       QAData. Ignored by the other serializers.
             
         Returns:
             Any: The deserialized Python object. Returns `None` if the input data
@@ -146,15 +351,89 @@ class LMDBStorage:
             
         # Decompress if data was compressed
         try:
-            if self.compress:
-                data = zlib.decompress(data)
+            if self.compress and data[0] != _PICKLE_PROTO:
+                data = self._decompress(data)
                 
+            if self.serializer == "json":
+                return orjson.loads(data) if orjson is not None else json.loads(bytes(data))
+            if self.serializer == "msgpack":
+                try:
+                    return _msgpack_decoder(type_hint or Any).decode(data)
+                except msgspec.DecodeError as e:
+                    raise ValueError(str(e)) from e
             # Use pickle to load the original Python object
             return pickle.loads(data)
-        except (zlib.error, pickle.UnpicklingError, TypeError) as e:
+        except (zlib.error, pickle.UnpicklingError, TypeError, ValueError) as e:
             logger.error(f"Error deserializing data: {e}")
             return None
+
+    @staticmethod
+    def _to_json(value: Any) -> bytes:
+        """
+        Encodes a value as JSON bytes, dumping Pydantic models to dicts first.
+
+        Dataclasses such as QAData are encoded natively by orjson and converted
+        with asdict() for the standard json module.
+
+        Args:
+            value (Any): A JSON-compatible value, dataclass or Pydantic model.
+
+        Returns:
+            bytes: The UTF-8 JSON encoding of the value.
+        """
+        if hasattr(value, 'model_dump'):
+            value = value.model_dump()
+        if orjson is not None:
+            return orjson.dumps(value)
+        if is_dataclass(value) and not isinstance(value, type):
+            value = asdict(value)
+        return json.dumps(value, ensure_ascii=False).encode('utf-8')
     
+    def prewarm(self) -> None:
+        """
+        Loads the used part of the database file into the OS page cache.
+        
+        Only the pages LMDB has written are read, which can be far less than
+        the file size, e.g. for a file preallocated by writemap. Where
+        available, posix_fadvise(WILLNEED) asks the kernel to read them in the
+        background; elsewhere a daemon thread reads them once sequentially.
+        Either way this returns immediately, and later reads through the
+        memory map hit the cache instead of faulting pages in one at a time.
+        """
+        used_size = (self.env.info()['last_pgno'] + 1) * self.env.stat()['psize']
+        data_file = os.path.join(self.db_path, 'data.mdb')
+        if hasattr(os, 'posix_fadvise'):
+            try:
+                fd = os.open(data_file, os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, used_size, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+            except OSError as e:
+                logger.error(f"Error prewarming {data_file}: {e}")
+            return
+        threading.Thread(
+            target=self._read_file_head,
+            args=(data_file, used_size),
+            name="lmdb-prewarm",
+            daemon=True
+        ).start()
+
+    @staticmethod
+    def _read_file_head(path: str, size: int) -> None:
+        """Reads and discards the first `size` bytes of a file."""
+        try:
+            with open(path, 'rb', buffering=0) as f:
+                buffer = memoryview(bytearray(1 << 20))
+                remaining = size
+                while remaining > 0:
+                    read = f.readinto(buffer[:min(len(buffer), remaining)])
+                    if not read:
+                        break
+                    remaining -= read
+        except OSError as e:
+            logger.error(f"Error prewarming {path}: {e}")
+
     def put(self, key: str, value: Any) -> bool:
         """
         Stores a key-value pair in the database.
@@ -179,13 +458,77 @@ class LMDBStorage:
         try:
             with self.env.begin(write=True) as txn:
                 serialized = self._serialize(value)
-                txn.put(key.encode('utf-8'), serialized)
+                txn.put(_encode_key(key), serialized)
             return True
         except Exception as e:
             logger.error(f"Error storing key '{key}': {e}")
             return False
     
-    def get(self, key: str, default: Any = None) -> Any:
+    def put_many(self, items: Iterable[Tuple[str, Any]], batch_size: int = 4096, append: bool = False) -> int:
+        """
+        Stores many key-value pairs using one write transaction per batch.
+        
+        Values are serialized up front and each batch is written with a single
+        cursor putmulti() call, so the per-item work inside the transaction
+        happens in C, and the commit cost is paid once per `batch_size` items
+        instead of once per item. Items whose value cannot be serialized are
+        logged and skipped, as with put().
+        
+        Args:
+            items (Iterable[Tuple[str, Any]]): The (key, value) pairs to store.
+                                               May be a generator.
+            batch_size (int, optional): Number of items written per transaction.
+                                        Defaults to 4096.
+            append (bool, optional): If True, use LMDB's append mode, which skips
+                                     the B-tree search. Only valid when the keys
+                                     arrive in strictly increasing byte order
+                                     after every existing key. Defaults to False.
+            
+        Returns:
+            int: The number of items stored.
+            
+        Raises:
+            TypeError: If a key is not a string.
+            ValueError: If batch_size is not positive.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+            
+        stored = 0
+        batch = []
+        for key, value in items:
+            if not isinstance(key, str):
+                raise TypeError("Key must be a string.")
+            try:
+                batch.append((key.encode('utf-8'), self._serialize(value)))
+            except Exception as e:
+                logger.error(f"Error storing key '{key}': {e}")
+                continue
+            if len(batch) >= batch_size:
+                stored += self._write_batch(batch, append)
+                batch = []
+        if batch:
+            stored += self._write_batch(batch, append)
+        return stored
+
+    def _write_batch(self, batch: List[Tuple[bytes, bytes]], append: bool) -> int:
+        """
+        Writes encoded (key, value) pairs in one transaction and returns how many were added.
+        
+        If the memory map fills up, the aborted batch is retried after doubling
+        the map size, so bulk writes do not need an exact size up front.
+        """
+        while True:
+            try:
+                with self.env.begin(write=True) as txn:
+                    _, added = txn.cursor().putmulti(batch, append=append)
+                return added
+            except lmdb.MapFullError:
+                new_size = self.env.info()['map_size'] * 2
+                logger.info(f"LMDB map is full, growing it to {new_size} bytes")
+                self.env.set_mapsize(new_size)
+    
+    def get(self, key: str, default: Any = None, type_hint: Any = None) -> Any:
         """
         Retrieves a value by its key from the database.
 
@@ -193,6 +536,8 @@ class LMDBStorage:
             key (str): The string key of the value to retrieve.
             default (Any, optional): The value to return if the key is not found.
                                      Defaults to None.
+            type_hint (Any, optional): With the msgpack serializer, the type to
+                                       decode the value into (e.g. QAData).
             
         Returns:
             Any: The stored Python object associated with the key. Returns the
@@ -205,13 +550,15 @@ class LMDBStorage:
             raise TypeError("Key must be a string.")
             
         try:
-            with self.env.begin() as txn:
-                value_bytes = txn.get(key.encode('utf-8'))
+            # The buffers reader returns a view into the memory map instead of
+            # a copy; it is only valid until the transaction ends
+            with self.env.begin(buffers=True) as txn:
+                value_bytes = txn.get(_encode_key(key))
                 
                 if value_bytes is None:
                     return default
                 
-                return self._deserialize(value_bytes)
+                return self._deserialize(value_bytes, type_hint)
         except Exception as e:
             logger.error(f"Error retrieving key '{key}': {e}")
             return default
@@ -232,7 +579,7 @@ class LMDBStorage:
         try:
             with self.env.begin(write=True) as txn:
                 # delete() returns True if the key was deleted, False otherwise
-                result = txn.delete(key.encode('utf-8'))
+                result = txn.delete(_encode_key(key))
             if not result:
                 logger.warning(f"Key '{key}' not found, no deletion performed.")
             return result
@@ -273,13 +620,39 @@ class LMDBStorage:
             raise TypeError("Key must be a string.")
             
         try:
-            with self.env.begin() as txn:
-                value_bytes = txn.get(key.encode('utf-8'))
-                return value_bytes is not None
+            with self.env.begin(buffers=True) as txn:
+                # Position a cursor on the key; the value is never fetched
+                return txn.cursor().set_key(_encode_key(key))
         except Exception as e:
             logger.error(f"Error checking key existence '{key}': {e}")
             return False
 
+    def prefix_exists(self, prefix: str) -> bool:
+        """
+        Checks if any key starts with the given prefix, e.g. "default/train/".
+        
+        Args:
+            prefix (str): The key prefix to look for.
+            
+        Returns:
+            bool: True if at least one key has the prefix, False otherwise.
+            
+        Raises:
+            TypeError: If the provided prefix is not a string.
+        """
+        if not isinstance(prefix, str):
+            raise TypeError("Prefix must be a string.")
+            
+        prefix_bytes = prefix.encode('utf-8')
+        try:
+            with self.env.begin() as txn:
+                # The first key >= prefix is the only candidate
+                cursor = txn.cursor()
+                return cursor.set_range(prefix_bytes) and cursor.key().startswith(prefix_bytes)
+        except Exception as e:
+            logger.error(f"Error checking key prefix '{prefix}': {e}")
+            return False
+
     def get_keys(self) -> List[str]:
         """
         Retrieves all keys from the database.
@@ -287,53 +660,129 @@ class LMDBStorage:
         Returns:
             List[str]: A list of all keys in the database as strings.
         """
-        keys = []
         try:
             with self.env.begin() as txn:
-                # Use a cursor to iterate through all key-value pairs
-                cursor = txn.cursor()
-                for key, _ in cursor:
-                    keys.append(key.decode('utf-8'))
+                # Walk the keys only, then decode them all in one C-level map
+                key_bytes = list(txn.cursor().iternext(keys=True, values=False))
+            return list(map(bytes.decode, key_bytes))
         except Exception as e:
             logger.error(f"Error retrieving keys: {e}")
-        return keys
+            return []
 
-    def all_items(self) -> Dict[str, Any]:
+    def iter_keys(self) -> Iterator[str]:
         """
-        Retrieves all key-value pairs from the database as a dictionary.
+        Yields all keys from the database in key order, one at a time.
+        
+        The read transaction stays open until the generator is exhausted or
+        closed.
+        
+        Yields:
+            str: Each key in the database.
+        """
+        try:
+            with self.env.begin() as txn:
+                # Walk the keys only; values are never fetched
+                for key in txn.cursor().iternext(keys=True, values=False):
+                    yield key.decode('utf-8')
+        except Exception as e:
+            logger.error(f"Error retrieving keys: {e}")
+
+    def keys_startingwith(self, prefix: str) -> Set[str]:
+        """
+        Retrieves all keys that start with the given prefix.
+        
+        Keys are stored in sorted order, so this positions a cursor at the
+        first key >= prefix and walks forward without fetching any values.
         
+        Args:
+            prefix (str): The key prefix to match.
+            
         Returns:
-            Dict[str, Any]: A dictionary where keys are strings and values are
-                            the deserialized Python objects from the database.
+            Set[str]: The set of matching keys.
+            
+        Raises:
+            TypeError: If the provided prefix is not a string.
         """
-        result = {}
+        if not isinstance(prefix, str):
+            raise TypeError("Prefix must be a string.")
+            
+        prefix_bytes = prefix.encode('utf-8')
+        keys = set()
         try:
             with self.env.begin() as txn:
                 cursor = txn.cursor()
-                for key_bytes, value_bytes in cursor:
+                if cursor.set_range(prefix_bytes):
+                    for key in cursor.iternext(keys=True, values=False):
+                        if not key.startswith(prefix_bytes):
+                            break
+                        keys.add(key.decode('utf-8'))
+        except Exception as e:
+            logger.error(f"Error retrieving keys with prefix '{prefix}': {e}")
+        return keys
+
+    def iter_items(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Yields all key-value pairs from the database in key order.
+        
+        Only one deserialized value is alive at a time, and the caller can stop
+        early without deserializing the rest. The read transaction stays open
+        until the generator is exhausted or closed.
+        
+        Yields:
+            Tuple[str, Any]: The key and its deserialized value.
+        """
+        try:
+            # Deserialize straight from views into the memory map
+            with self.env.begin(buffers=True) as txn:
+                for key_bytes, value_bytes in txn.cursor().iternext():
                     try:
-                        key_str = key_bytes.decode('utf-8')
-                        result[key_str] = self._deserialize(value_bytes)
+                        key_str = str(key_bytes, 'utf-8')
+                        value = self._deserialize(value_bytes)
                     except Exception as e:
-                        logger.error(f"Error processing item with key {key_bytes}: {e}")
+                        logger.error(f"Error processing item with key {bytes(key_bytes)}: {e}")
                         continue
+                    yield key_str, value
         except Exception as e:
             logger.error(f"Error retrieving all items: {e}")
-        return result
+
+    def all_items(self) -> Dict[str, Any]:
+        """
+        Retrieves all key-value pairs from the database as a dictionary.
         
-    def from_json(self, file_path: str, clear_existing: bool = False) -> bool:
+        This holds every deserialized value in memory; prefer `iter_items` for
+        large databases.
+        
+        Returns:
+            Dict[str, Any]: A dictionary where keys are strings and values are
+                            the deserialized Python objects from the database.
+        """
+        return dict(self.iter_items())
+        
+    def from_json(self, file_path: str, clear_existing: bool = False, sorted_append: bool = True) -> bool:
         """
         Imports data from a JSON file into the LMDB database.
         
         This method is designed to load data from a standard JSON file where
-        the top-level structure is a key-value dictionary. All values are
-        stored as Python objects using `pickle` serialization.
+        the top-level structure is a key-value dictionary. Values are stored
+        with the configured serializer.
+        
+        The whole import, including clearing existing data, is written in one
+        transaction, so a file that fails to parse leaves the database as it
+        was. When ijson is installed the file is parsed incrementally and only
+        one record is held in memory at a time.
 
         Args:
             file_path (str): The path to the JSON file containing the data.
             clear_existing (bool, optional): If True, all existing data in the
                                              database will be cleared before
                                              importing the new data. Defaults to False.
+            sorted_append (bool, optional): If True, keys that arrive in
+                                            increasing order after every
+                                            existing key are written with
+                                            LMDB's append mode, which avoids
+                                            page splits and packs pages fully.
+                                            Other keys use ordinary puts.
+                                            Defaults to True.
                             
         Returns:
             bool: True if the import was successful, False otherwise.
@@ -349,17 +798,19 @@ class LMDBStorage:
             raise FileNotFoundError(f"JSON file not found: {file_path}")
             
         try:
-            # Read and parse JSON file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-            # Clear existing data if requested
-            if clear_existing:
-                self.clear()
-                
-            # Store data in LMDB
-            for key, value in data.items():
-                self.put(str(key), value)
+            while True:
+                try:
+                    with open(file_path, 'rb') as f:
+                        self._import_items(self._iter_json_items(f), clear_existing, sorted_append)
+                    break
+                except lmdb.MapFullError:
+                    # Nothing was committed; grow the map and import again
+                    new_size = self.env.info()['map_size'] * 2
+                    logger.info(f"LMDB map is full, growing it to {new_size} bytes")
+                    self.env.set_mapsize(new_size)
+            if not (self.config.sync and self.config.metasync):
+                # Flush the unsynced commit now that the import is done
+                self.sync()
                     
             return True
             
@@ -369,7 +820,54 @@ class LMDBStorage:
         except Exception as e:
             logger.error(f"Error importing data from JSON: {e}")
             return False
+
+    def _import_items(self, items: Iterable[Tuple[str, Any]], clear_existing: bool, append: bool) -> None:
+        """
+        Writes (key, value) pairs in a single write transaction.
+        
+        If the items raise part way through, the transaction is aborted and
+        neither the clear nor any item is committed. With append, each key is
+        first tried in append mode; LMDB rejects that unless the key sorts
+        after every key in the database, and the item is then written with an
+        ordinary put. Ordinary puts overwrite, so a later duplicate key keeps
+        the last value, as json.load does. Items whose value cannot be
+        serialized are logged and skipped, as with put().
+        """
+        with self.env.begin(write=True) as txn:
+            if clear_existing:
+                txn.drop(self.db, delete=False)
+            cursor = txn.cursor()
+            for key, value in items:
+                try:
+                    data = self._serialize(value)
+                except Exception as e:
+                    logger.error(f"Error storing key '{key}': {e}")
+                    continue
+                key_bytes = key.encode('utf-8')
+                if not (append and cursor.put(key_bytes, data, append=True)):
+                    cursor.put(key_bytes, data)
             
+    @staticmethod
+    def _iter_json_items(file: Any) -> Iterator[Tuple[str, Any]]:
+        """
+        Yields the (key, value) pairs of a JSON object read from a binary file.
+        
+        Uses ijson to stream the pairs when it is installed, otherwise loads
+        the whole document with the json module.
+        
+        Raises:
+            json.JSONDecodeError: If the file contains invalid JSON.
+        """
+        if ijson is None:
+            for key, value in json.load(file).items():
+                yield str(key), value
+            return
+        try:
+            for key, value in ijson.kvitems(file, '', use_float=True):
+                yield str(key), value
+        except ijson.JSONError as e:
+            raise json.JSONDecodeError(str(e), '', 0) from e
+
     def clear(self) -> bool:
         """
         Clears all data from the database.
@@ -388,9 +886,17 @@ class LMDBStorage:
             logger.error(f"Error clearing database: {str(e)}")
             return False
             
+    def sync(self) -> None:
+        """Flushes all committed data to disk."""
+        if self.env is not None:
+            self.env.sync(True)
+
     def close(self) -> None:
         """Closes the database connection, freeing up system resources."""
         if self.env is not None:
+            if not (self.config.sync and self.config.metasync):
+                # Flush commits that were not synced to disk individually
+                self.sync()
             self.env.close()
             self.env = None
             
@@ -422,14 +928,14 @@ class LMDBStorage:
         """
         return self.count_keys()
         
-    def __iter__(self) -> iter:
+    def __iter__(self) -> Iterator[str]:
         """
         Returns an iterator over the keys in the database.
         
         This method allows for iterating directly over the storage keys, such as
-        in a `for` loop.
+        in a `for` loop. Keys are decoded lazily rather than collected first.
         """
-        return iter(self.get_keys())
+        return self.iter_keys()
 
 # Example usage
 if __name__ == "__main__":
@@ -520,10 +1026,9 @@ if __name__ == "__main__":
         print("Has key 'user:1:name'?", storage.has_key("user:1:name"))
         print("Has key 'user:99'?", storage.has_key("user:99"))
         
-        # Retrieve all data as a dict
+        # Iterate over all items
         print("\n--- All Items ---")
-        all_items = storage.all_items()
-        for key, value in all_items.items():
+        for key, value in storage.iter_items():
             print(f"'{key}': {value}")
             
         # Delete a key
@@ -0,0 +1,83 @@
+"""
+Background prefetching for iterators.
+
+Wrapping a producer such as dataset row extraction in prefetch() runs it in a
+daemon thread that fills a bounded queue, so the caller's work on each item
+(for example LMDB writes) overlaps with producing the next ones. Arrow reads,
+image codecs and LMDB all release the GIL for most of their work.
+"""
+
+import queue
+import threading
+from typing import Any, Iterable, Iterator, TypeVar
+
+T = TypeVar('T')
+
+# Marks the end of the source iterator in the queue
+_END = object()
+
+
+class _Failure:
+    """Carries an exception raised by the source iterator to the consumer."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def prefetch(iterable: Iterable[T], size: int = 64, name: str = "prefetch") -> Iterator[T]:
+    """
+    Yields the items of an iterable, produced ahead of time in a background thread.
+
+    Args:
+        iterable: The source of items. It is consumed in the background thread
+        size: Maximum number of items buffered ahead of the consumer
+        name: Name of the background thread, shown in debuggers and tracebacks
+
+    Yields:
+        The items of the iterable, in order.
+
+    Raises:
+        Exception: Whatever the source iterator raised, re-raised in the
+                   consumer once the items before it have been yielded.
+    """
+    items: queue.Queue = queue.Queue(maxsize=max(1, size))
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+        # Block while the queue is full, but give up once the consumer stops
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        iterator = iter(iterable)
+        try:
+            for item in iterator:
+                if not put(item):
+                    return
+        except Exception as e:
+            put(_Failure(e))
+            return
+        finally:
+            # Release the source's resources (open files, pools) in this thread
+            close = getattr(iterator, 'close', None)
+            if close is not None:
+                close()
+        put(_END)
+
+    producer = threading.Thread(target=produce, name=name, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = items.get()
+            if item is _END:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
@@ -5,7 +5,7 @@ import io
 import numpy as np
 from typing import Any, List, Dict, Optional
 
-from sophoset.utils.lmdb_storage import LMDBStorage, Config
+from sophoset.utils.lmdb_storage import LMDBStorage, Config, sniff_image_format
 
 # Set page config
 st.set_page_config(page_title="LMDB Viewer", layout="wide")
@@ -16,18 +16,21 @@ def display_value(value: Any) -> Any:
         return "Value is None"
     
     if isinstance(value, bytes):
-        # Try to display as image
-        try:
-            img = Image.open(io.BytesIO(value))
-            st.image(img, caption="Image from bytes")
-            return
-        except:
-            pass
+        # Only hand data with a known image signature to PIL
+        if sniff_image_format(value):
+            try:
+                img = Image.open(io.BytesIO(value))
+                st.image(img, caption="Image from bytes")
+                return
+            except Exception:
+                pass
         
         # Try to display as text
+        if value.isascii():
+            return value.decode('ascii')
         try:
             return value.decode('utf-8')
-        except:
+        except UnicodeDecodeError:
             return f"Binary data (length: {len(value)} bytes)"
     
     elif isinstance(value, (str, int, float, bool)):
@@ -52,12 +55,14 @@ def get_all_keys(storage: LMDBStorage) -> List[str]:
     keys = []
     with storage.env.begin() as txn:
         cursor = txn.cursor()
-        for key, _ in cursor:
-            try:
-                keys.append(key.decode('utf-8'))
-            except UnicodeDecodeError:
-                # Handle non-UTF-8 keys
-                keys.append(str(key))
+        keys_append = keys.append
+        for key in cursor.iternext(keys=True, values=False):
+            # Keys are almost always ASCII, which decodes without UTF-8 validation
+            if key.isascii():
+                keys_append(key.decode('ascii'))
+                continue
+            # Invalid UTF-8 bytes become surrogates instead of raising
+            keys_append(key.decode('utf-8', errors='surrogateescape'))
     return keys
 
 def parse_args():
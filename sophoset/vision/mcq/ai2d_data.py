@@ -30,9 +30,7 @@ class AI2DDataset(BaseHFDataset):
         options_list = row.get('options', [])
 
         # Extract raw images - store as-is
-        images = row.get('image', [])
-        if not isinstance(images, list):
-            images = [images] if images else []
+        images = self.as_image_list(row.get('image', []))
 
         # Format options to dict with letter keys
         formatted_options = self.get_formatted_options(options_list)
@@ -44,6 +42,28 @@ class AI2DDataset(BaseHFDataset):
             options=formatted_options
         )
 
+    def batch_extract(self, batch: Dict[str, List[Any]], indices: List[int]) -> List[QAData]:
+        """Extract AI2D rows column-wise.
+
+        Args:
+            batch: Mapping of column name to the list of values in the batch
+            indices: The dataset indices of the rows in the batch
+
+        Returns:
+            List of QAData objects, one per row in the batch
+        """
+        return [
+            QAData(
+                key=self.get_key(index),
+                question=question,
+                images=self.as_image_list(images),
+                options=self.get_formatted_options(options)
+            )
+            for index, question, options, images in zip(
+                indices, batch['question'], batch['options'], batch['image']
+            )
+        ]
+
 if __name__ == "__main__":
     dset = AI2DDataset()
     explorer = DatasetExplorer(dset)
@@ -33,11 +33,7 @@ class BlinkDataset(BaseHFDataset):
         options_list = row.get('options', [])
 
         # Extract raw images (context and candidate images)
-        images = []
-        if 'context' in row and 'image' in row['context']:
-            images.append(row['context']['image'])
-        if 'candidate' in row and 'image' in row['candidate']:
-            images.append(row['candidate']['image'])
+        images = self._context_images(row.get('context'), row.get('candidate'))
 
         # Get the correct answer
         answer = row.get('answer', "")
@@ -53,6 +49,41 @@ class BlinkDataset(BaseHFDataset):
             answer=answer
         )
 
+    def batch_extract(self, batch: Dict[str, List[Any]], indices: List[int]) -> List[QAData]:
+        """Extract BLINK rows column-wise.
+
+        Args:
+            batch: Mapping of column name to the list of values in the batch
+            indices: The dataset indices of the rows in the batch
+
+        Returns:
+            List of QAData objects, one per row in the batch
+        """
+        missing = [None] * len(indices)
+        return [
+            QAData(
+                key=self.get_key(index),
+                question=question,
+                options=self.get_formatted_options(options),
+                images=self._context_images(context, candidate),
+                answer=answer
+            )
+            for index, question, options, answer, context, candidate in zip(
+                indices, batch['question'], batch['options'], batch['answer'],
+                batch.get('context', missing), batch.get('candidate', missing)
+            )
+        ]
+
+    @staticmethod
+    def _context_images(context: Optional[Dict[str, Any]], candidate: Optional[Dict[str, Any]]) -> List[Any]:
+        """Collect the context and candidate images that are present."""
+        images = []
+        if context and 'image' in context:
+            images.append(context['image'])
+        if candidate and 'image' in candidate:
+            images.append(candidate['image'])
+        return images
+
 if __name__ == "__main__":
     dset = BlinkDataset()
     explorer = DatasetExplorer(dset)
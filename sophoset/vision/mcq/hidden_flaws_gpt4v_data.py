@@ -32,9 +32,7 @@ class HiddenFlawsGPT4VDataset(BaseHFDataset):
         answer = row.get('answer', '')
 
         # Extract raw images - store as-is
-        images = row.get('image', [])
-        if not isinstance(images, list):
-            images = [images] if images else []
+        images = self.as_image_list(row.get('image', []))
 
         # Format options to dict with letter keys
         formatted_options = self.get_formatted_options(options_list)
@@ -47,6 +45,29 @@ class HiddenFlawsGPT4VDataset(BaseHFDataset):
             images=images
         )
 
+    def batch_extract(self, batch: Dict[str, List[Any]], indices: List[int]) -> List[QAData]:
+        """Extract Hidden Flaws rows column-wise.
+
+        Args:
+            batch: Mapping of column name to the list of values in the batch
+            indices: The dataset indices of the rows in the batch
+
+        Returns:
+            List of QAData objects, one per row in the batch
+        """
+        return [
+            QAData(
+                key=self.get_key(index),
+                question=question,
+                options=self.get_formatted_options(options),
+                answer=answer,
+                images=self.as_image_list(images)
+            )
+            for index, question, options, answer, images in zip(
+                indices, batch['question'], batch['options'], batch['answer'], batch['image']
+            )
+        ]
+
 
 if __name__ == "__main__":
     dataset = HiddenFlawsGPT4VDataset()
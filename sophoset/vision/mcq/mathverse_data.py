@@ -1,5 +1,6 @@
+import logging
 import re
-from typing import Dict, Any, List, Optional, Literal
+from typing import Dict, Any, List, Optional, Literal, Tuple
 import os
 from pathlib import Path
 
@@ -7,10 +8,17 @@ from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
 from sophoset.utils.dataset_explorer import DatasetExplorer
 
+logger = logging.getLogger(__name__)
+
+# The question is everything before 'Choices:' and the options are everything after
+_CHOICES_RE = re.compile(r'(.*?)\s*Choices:\s*\n(.*)', re.DOTALL | re.IGNORECASE)
+
 class MathVerseDataset(BaseHFDataset):
     """A class to handle loading and interacting with the MathVerse dataset."""
 
     DATASET_NAME = "AI4Math/MathVerse"
+    # Only these columns are decoded for batch_extract()
+    BATCH_COLUMNS = ['question', 'options', 'answer', 'image']
 
     def __init__(self):
         """
@@ -30,28 +38,54 @@ class MathVerseDataset(BaseHFDataset):
                   is a string and 'options' is a list of strings.
                   Returns None if the format is not recognized.
         """
-        # Use a regex to find the question and the choices section.
-        # The question is everything before 'Choices:' and the options are everything after.
-        match = re.search(r'(.*?)\s*Choices:\s*\n(.*)', text, re.DOTALL | re.IGNORECASE)
+        parts = self._split_choices(text)
 
-        if not match:
-            print("Error: 'Choices:' delimiter not found in the text.")
+        if parts is None:
+            logger.warning("'Choices:' delimiter not found in the text.")
             return None
 
-        # Extract the question part and clean up whitespace
-        question_text = match.group(1).strip()
-
-        # Extract the raw options text
-        options_text = match.group(2).strip()
+        # The question part and the raw options text, with whitespace trimmed
+        question_text, options_text = parts
 
-        # Split the options text by newline to get individual options
-        # Then, clean up leading/trailing whitespace for each option
-        options_list = [opt.strip() for opt in options_text.split('\n') if opt.strip()]
+        # Split the options text into lines, strip each one and drop the
+        # blank ones, stripping every line once
+        options_list = list(filter(None, map(str.strip, options_text.splitlines())))
 
         # Return the extracted data in a dictionary
         return question_text, options_list
 
 
+    @staticmethod
+    def _split_choices(text: str) -> Optional[Tuple[str, str]]:
+        """
+        Split text at the first 'Choices:' that is followed by a line break.
+
+        ASCII text is searched with str.find on a lowercased copy, which is a
+        plain substring scan; other text, where lowercasing may change string
+        offsets, goes through the equivalent regex.
+
+        Args:
+            text: The input string containing the question and choices
+
+        Returns:
+            The stripped question text and options text, or None if there is
+            no such delimiter
+        """
+        if not text.isascii():
+            match = _CHOICES_RE.search(text)
+            return (match.group(1).strip(), match.group(2).strip()) if match else None
+
+        lower = text.lower()
+        start = lower.find('choices:')
+        while start >= 0:
+            rest = text[start + len('choices:'):]
+            options_text = rest.lstrip()
+            # Like the regex, require a newline in the whitespace after the delimiter
+            if '\n' in rest[:len(rest) - len(options_text)]:
+                return text[:start].strip(), options_text.rstrip()
+            start = lower.find('choices:', start + 1)
+        return None
+
     def extract_row_data(self, row: Dict[str, Any], index: int) -> QAData:
         """
         Extract and format data from a dataset row.
@@ -68,9 +102,7 @@ class MathVerseDataset(BaseHFDataset):
         answer = row.get('answer', '')
 
         # Extract raw images - store as-is
-        images = row.get('image', [])
-        if not isinstance(images, list):
-            images = [images] if images else []
+        images = self.as_image_list(row.get('image', []))
 
         # Format options to dict with letter keys
         formatted_options = self.get_formatted_options(options_list)
@@ -83,6 +115,29 @@ class MathVerseDataset(BaseHFDataset):
             images=images
         )
 
+    def batch_extract(self, batch: Dict[str, List[Any]], indices: List[int]) -> List[QAData]:
+        """Extract MathVerse rows column-wise.
+
+        Args:
+            batch: Mapping of column name to the list of values in the batch
+            indices: The dataset indices of the rows in the batch
+
+        Returns:
+            List of QAData objects, one per row in the batch
+        """
+        return [
+            QAData(
+                key=self.get_key(index),
+                question=question,
+                options=self.get_formatted_options(options),
+                answer=answer,
+                images=self.as_image_list(images)
+            )
+            for index, question, options, answer, images in zip(
+                indices, batch['question'], batch['options'], batch['answer'], batch['image']
+            )
+        ]
+
 
 if __name__ == "__main__":
     dataset = MathVerseDataset()
@@ -6,10 +6,15 @@ from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
 from sophoset.utils.dataset_explorer import DatasetExplorer
 
+# Option letters, indexed by the 0-based answer
+_LETTERS = tuple(chr(65 + i) for i in range(26))
+
 class MathVisionDataset(BaseHFDataset):
     """A class to handle loading and interacting with the MathVision dataset."""
 
     DATASET_NAME = "MathLLMs/MathVision"
+    # Only these columns are decoded for batch_extract()
+    BATCH_COLUMNS = ['question', 'options', 'answer', 'decoded_image']
 
     def __init__(self, split: str = "test"):
         """
@@ -37,9 +42,7 @@ class MathVisionDataset(BaseHFDataset):
         answer = row.get('answer', '')
 
         # Format the answer with the selected choice if available
-        formatted_answer = answer
-        if choices_list and answer.isdigit() and 0 <= int(answer) < len(choices_list):
-            formatted_answer = f"{choices_list[int(answer)]} (Option {chr(65 + int(answer))})"
+        formatted_answer = self._format_answer(answer, choices_list)
 
         # Extract raw images - store as-is
         images = []
@@ -48,7 +51,8 @@ class MathVisionDataset(BaseHFDataset):
             images.append(image)
 
         # Format options to dict with letter keys
-        formatted_options = self.get_formatted_options(choices_list)
+        # Free-form questions have no options; skip formatting for them
+        formatted_options = self.get_formatted_options(choices_list) if choices_list else {}
 
         return QAData(
             key=self.get_key(index),
@@ -58,6 +62,51 @@ class MathVisionDataset(BaseHFDataset):
             answer=formatted_answer,
         )
 
+    def batch_extract(self, batch: Dict[str, List[Any]], indices: List[int]) -> List[QAData]:
+        """Extract MathVision rows column-wise.
+
+        Args:
+            batch: Mapping of column name to the list of values in the batch
+            indices: The dataset indices of the rows in the batch
+
+        Returns:
+            List of QAData objects, one per row in the batch
+        """
+        return [
+            QAData(
+                key=self.get_key(index),
+                question=question,
+                images=[image] if image is not None else [],
+                options=self.get_formatted_options(choices) if choices else {},
+                answer=self._format_answer(answer, choices),
+            )
+            for index, question, choices, answer, image in zip(
+                indices, batch['question'], batch['options'], batch['answer'], batch['decoded_image']
+            )
+        ]
+
+    @staticmethod
+    def _format_answer(answer: str, choices: List[str]) -> str:
+        """Append the chosen option to a 0-based numeric answer.
+
+        Args:
+            answer: The raw answer, an option index for multiple-choice rows
+            choices: The row's options
+
+        Returns:
+            "<option> (Option <letter>)" for a valid index, else the answer as-is
+        """
+        if not choices:
+            return answer
+        # Parse the answer once; non-numeric answers are left as-is
+        try:
+            choice = int(answer)
+        except (TypeError, ValueError):
+            return answer
+        if 0 <= choice < min(len(choices), len(_LETTERS)):
+            return f"{choices[choice]} (Option {_LETTERS[choice]})"
+        return answer
+
 
 if __name__ == "__main__":
     # Create the dataset
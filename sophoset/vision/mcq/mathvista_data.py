@@ -10,6 +10,8 @@ class MathVistaDataset(BaseHFDataset):
     """A class to handle loading and interacting with the MathVista dataset."""
 
     DATASET_NAME = "AI4Math/MathVista"
+    # Only these columns are decoded for batch_extract()
+    BATCH_COLUMNS = ['question', 'options', 'answer', 'image']
 
     def __init__(self, split: str = "test"):
         """
@@ -37,12 +39,11 @@ class MathVistaDataset(BaseHFDataset):
         answer = row.get('answer', '')
 
         # Extract raw images - store as-is
-        images = row.get('image', [])
-        if not isinstance(images, list):
-            images = [images] if images else []
+        images = self.as_image_list(row.get('image', []))
 
         # Format options to dict with letter keys
-        formatted_options = self.get_formatted_options(options_list)
+        # Free-form questions have no options; skip formatting for them
+        formatted_options = self.get_formatted_options(options_list) if options_list else {}
 
         return QAData(
             key=self.get_key(index),
@@ -52,6 +53,29 @@ class MathVistaDataset(BaseHFDataset):
             images=images
         )
 
+    def batch_extract(self, batch: Dict[str, List[Any]], indices: List[int]) -> List[QAData]:
+        """Extract MathVista rows column-wise.
+
+        Args:
+            batch: Mapping of column name to the list of values in the batch
+            indices: The dataset indices of the rows in the batch
+
+        Returns:
+            List of QAData objects, one per row in the batch
+        """
+        return [
+            QAData(
+                key=self.get_key(index),
+                question=question,
+                options=self.get_formatted_options(options) if options else {},
+                answer=answer,
+                images=self.as_image_list(images)
+            )
+            for index, question, options, answer, images in zip(
+                indices, batch['question'], batch['options'], batch['answer'], batch['image']
+            )
+        ]
+
 
 if __name__ == "__main__":
     # Create the dataset
@@ -31,9 +31,7 @@ class ScienceQADataset(BaseHFDataset):
         answer = row.get('answer', '')
 
         # Extract raw images - store as-is
-        images = row.get('image', [])
-        if not isinstance(images, list):
-            images = [images] if images else []
+        images = self.as_image_list(row.get('image', []))
 
         # Format options to dict with letter keys
         formatted_options = self.get_formatted_options(options_list)
@@ -6,10 +6,15 @@ from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
 from sophoset.utils.dataset_explorer import DatasetExplorer
 
+_OPTION_COLUMNS = ('A', 'B', 'C', 'D')
+_get_options = BaseHFDataset.field_getter(*_OPTION_COLUMNS)
+
 class WorldMedQADataset(BaseHFDataset):
     """A class to handle loading and interacting with the WorldMedQA dataset."""
 
     DATASET_NAME = "WorldMedQA/V"
+    # Only these columns are decoded for batch_extract()
+    BATCH_COLUMNS = ['question', 'A', 'B', 'C', 'D', 'correct_option', 'image']
 
     def __init__(self):
         """Initialize the WorldMedQA dataset handler.
@@ -28,11 +33,8 @@ class WorldMedQADataset(BaseHFDataset):
             QAData object containing the formatted row data
         """
         question = row.get('question', '')
-        options_list = []
-        options_list.append(row.get("A", ""))
-        options_list.append(row.get("B", ""))
-        options_list.append(row.get("C", ""))
-        options_list.append(row.get("D", ""))
+        # The options already come as the lettered columns A-D
+        formatted_options = dict(zip(_OPTION_COLUMNS, _get_options(row)))
 
         # Extract raw images - store as-is
         image = row.get('image', None)
@@ -40,9 +42,6 @@ class WorldMedQADataset(BaseHFDataset):
 
         answer = row.get("correct_option", "")
 
-        # Format options to dict with letter keys
-        formatted_options = self.get_formatted_options(options_list)
-
         return QAData(
             key=self.get_key(index),
             question=question,
@@ -51,6 +50,31 @@ class WorldMedQADataset(BaseHFDataset):
             answer=answer
         )
 
+    def batch_extract(self, batch: Dict[str, List[Any]], indices: List[int]) -> List[QAData]:
+        """Extract WorldMedQA rows column-wise.
+
+        Args:
+            batch: Mapping of column name to the list of values in the batch
+            indices: The dataset indices of the rows in the batch
+
+        Returns:
+            List of QAData objects, one per row in the batch
+        """
+        return [
+            QAData(
+                key=self.get_key(index),
+                question=question,
+                options={'A': a, 'B': b, 'C': c, 'D': d},
+                images=[image] if image else [],
+                answer=answer
+            )
+            for index, question, a, b, c, d, answer, image in zip(
+                indices, batch['question'], batch['A'], batch['B'], batch['C'], batch['D'],
+                batch['correct_option'], batch['image']
+            )
+        ]
+
+
 if __name__ == "__main__":
     # Create the dataset
     dset = WorldMedQADataset()
@@ -10,6 +10,8 @@ class ChartQADataset(BaseHFDataset):
     """A class to handle loading and interacting with the ChartQA dataset."""
 
     DATASET_NAME = "HuggingFaceM4/ChartQA"
+    # Only these columns are decoded for batch_extract()
+    BATCH_COLUMNS = ['question', 'answer', 'image']
 
     def __init__(self):
         """
@@ -32,9 +34,7 @@ class ChartQADataset(BaseHFDataset):
         answer = row.get('answer', '')
 
         # Extract raw images - store as-is
-        images = row.get('image', [])
-        if not isinstance(images, list):
-            images = [images] if images else []
+        images = self.as_image_list(row.get('image', []))
 
         return QAData(
             key=self.get_key(index),
@@ -43,6 +43,29 @@ class ChartQADataset(BaseHFDataset):
             images=images
         )
 
+    def batch_extract(self, batch: Dict[str, List[Any]], indices: List[int]) -> List[QAData]:
+        """Extract ChartQA rows column-wise.
+
+        Args:
+            batch: Mapping of column name to the list of values in the batch
+            indices: The dataset indices of the rows in the batch
+
+        Returns:
+            List of QAData objects, one per row in the batch
+        """
+        return [
+            QAData(
+                key=self.get_key(index),
+                question=question,
+                answer=answer,
+                images=self.as_image_list(images)
+            )
+            for index, question, answer, images in zip(
+                indices, batch['question'], batch['answer'], batch['image']
+            )
+        ]
+
+
 if __name__ == "__main__":
     # Create the dataset
     dset = ChartQADataset()
@@ -32,9 +32,7 @@ class ChestXRayPneumoniaDataset(BaseHFDataset):
         answer = "Normal" if row.get('label') == 0 else "Pneumonia"
 
         # Extract raw images - store as-is
-        images = row.get('image', [])
-        if not isinstance(images, list):
-            images = [images] if images else []
+        images = self.as_image_list(row.get('image', []))
 
         return QAData(
             key=self.get_key(index),
@@ -0,0 +1,152 @@
+"""
+Export the open-ended vision datasets, several at a time.
+
+The datasets share nothing while exporting, so with --jobs above 1 each one
+runs in its own worker process and their downloads, image encoding and
+database writes overlap. With the default of one job they are exported in
+turn from this process, which still pays interpreter startup and the
+datasets/pyarrow imports only once.
+
+Usage:
+    python -m sophoset.vision.oeq.export_all -o datasets -j 4
+    python -m sophoset.vision.oeq.export_all -d roco_radiology visitbench -f arrow
+"""
+
+import argparse
+import importlib
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Type
+
+from sophoset.core.base_hf_dataset import BaseHFDataset
+from sophoset.utils.dataset_exporter import DatasetExporter
+
+logger = logging.getLogger(__name__)
+
+# Dictionary mapping dataset names to their module names in this package
+DATASET_MODULES = {
+    "animals": "animals_data",
+    "camo": "camo_data",
+    "chartqa": "chartqa_data",
+    "chest_xray_pneumonia": "chest_xray_pneumonia_data",
+    "culturalvqa": "culturalvqa_data",
+    "docvqa": "docvqa_data",
+    "iam_line": "iam_line_data",
+    "iam_sentences": "iam_sentences_data",
+    "illusionbench": "illusionbench_data",
+    "infovqa": "infovqa_data",
+    "kvasir_vqa": "kvasir_vqa_data",
+    "kvasir_vqa_x1": "kvasir_vqa_x1_data",
+    "mmstar": "mmstar_data",
+    "ocrbenchv2": "ocrbenchv2_data",
+    "olympicarena": "olympicareana_data",
+    "openmedcaseimages": "openmedcaseimages_data",
+    "openmedimages": "openmedimages_data",
+    "pd12m": "pd12m_data",
+    "realworldqa": "realworldqa_data",
+    "roco_radiology": "roco_radiology_data",
+    "snli_ve": "snli_ve_data",
+    "textvqa": "textvqa_data",
+    "visitbench": "visitbench_data",
+    "vlmsareblind": "vlmsareblind_data",
+    "vqa_rad": "vqa_rad_data"
+}
+
+
+def load_dataset_class(dataset_name: str) -> Type[BaseHFDataset]:
+    """Import a dataset module and return its BaseHFDataset subclass.
+
+    Raises:
+        ValueError: If the dataset name is unknown
+        ImportError: If the module cannot be imported or has no dataset class
+    """
+    if dataset_name not in DATASET_MODULES:
+        raise ValueError(f"Unknown dataset: {dataset_name}. Available datasets: {', '.join(DATASET_MODULES.keys())}")
+
+    module = importlib.import_module(f"{__package__ or 'sophoset.vision.oeq'}.{DATASET_MODULES[dataset_name]}")
+    for obj in module.__dict__.values():
+        if isinstance(obj, type) and issubclass(obj, BaseHFDataset) and obj is not BaseHFDataset:
+            return obj
+    raise ImportError(f"Could not find dataset class in {DATASET_MODULES[dataset_name]}")
+
+
+def export_one(dataset_name: str, format: str, output_dir: str, kwargs: Dict[str, Any]) -> bool:
+    """Export a single dataset, logging instead of raising on failure.
+
+    Returns:
+        bool: True if the dataset was exported
+    """
+    try:
+        dataset = load_dataset_class(dataset_name)()
+        logger.info(f"Exporting {dataset_name} ({dataset.dataset_name}) as {format}")
+        DatasetExporter.save(dataset, format=format, output_dir=output_dir, **kwargs)
+        return True
+    except Exception as e:
+        logger.error(f"Failed to export dataset {dataset_name}: {e}")
+        return False
+
+
+def export_all(dataset_names: List[str], format: str = 'lmdb', output_dir: str = 'datasets',
+               jobs: int = 1, **kwargs) -> List[str]:
+    """Export several datasets, up to `jobs` of them at once.
+
+    A dataset that fails to import or export is logged and skipped so the
+    remaining datasets are still exported. Each dataset writes its own
+    output file or database, so concurrent exports never share a writer.
+
+    Args:
+        dataset_names: Names from DATASET_MODULES to export
+        format: The output format ('json', 'lmdb' or 'arrow')
+        output_dir: Directory to save the output files
+        jobs: Number of datasets exported at the same time, each in its
+              own process. 1 exports them in turn in this process.
+        **kwargs: Additional arguments passed to DatasetExporter.save
+
+    Returns:
+        List[str]: The names of the datasets that failed
+    """
+    if not isinstance(jobs, int) or jobs < 1:
+        raise ValueError("jobs must be a positive integer")
+
+    if jobs == 1 or len(dataset_names) <= 1:
+        results = [export_one(name, format, output_dir, kwargs) for name in dataset_names]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(dataset_names))) as executor:
+            results = list(executor.map(
+                export_one,
+                dataset_names,
+                [format] * len(dataset_names),
+                [output_dir] * len(dataset_names),
+                [kwargs] * len(dataset_names)
+            ))
+    return [name for name, exported in zip(dataset_names, results) if not exported]
+
+
+def process_arguments():
+    """Process command line arguments."""
+    parser = argparse.ArgumentParser(description='Export open-ended vision datasets to JSON, LMDB or Arrow')
+    parser.add_argument("-d", "--datasets", nargs='+', default=list(DATASET_MODULES.keys()),
+                        choices=list(DATASET_MODULES.keys()), metavar='DATASET',
+                        help=f'Datasets to export (default: all). Available: {", ".join(DATASET_MODULES.keys())}')
+    parser.add_argument("-f", "--format", type=str, default='lmdb', choices=['json', 'lmdb', 'arrow'],
+                        help='Output format')
+    parser.add_argument("-o", "--output-dir", type=str, default='datasets',
+                        help='Directory to save the exported files')
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help='Number of datasets exported at the same time')
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help='Number of processes used to extract rows of each dataset')
+    return parser.parse_args()
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    args = process_arguments()
+    failed = export_all(args.datasets, format=args.format, output_dir=args.output_dir,
+                        jobs=args.jobs, num_workers=args.workers)
+    if failed:
+        logger.error(f"Failed to export: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
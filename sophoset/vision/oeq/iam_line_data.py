@@ -33,9 +33,7 @@ class IAMLineDataset(BaseHFDataset):
         answer = row.get('text', '')
 
         # Extract raw images - store as-is
-        images = row.get('image', [])
-        if not isinstance(images, list):
-            images = [images] if images else []
+        images = self.as_image_list(row.get('image', []))
 
         return QAData(
             key=self.get_key(index),
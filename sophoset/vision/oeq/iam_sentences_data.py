@@ -6,10 +6,15 @@ from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
 from sophoset.utils.dataset_explorer import DatasetExplorer
 
+# Every row asks the same question about its image
+_QUESTION = "What text is written in this image?"
+
 class IAMSentencesDataset(BaseHFDataset):
     """A class to handle loading and interacting with the IAM Sentences dataset."""
 
     DATASET_NAME = "alpayariyak/IAM_Sentences"
+    # Only these columns are decoded for batch_extract()
+    BATCH_COLUMNS = ['text', 'image']
 
     def __init__(self):
         """Initialize the dataset handler.
@@ -27,13 +32,11 @@ class IAMSentencesDataset(BaseHFDataset):
         Returns:
             QAData object containing the formatted row data
         """
-        question = "What text is written in this image?"
+        question = _QUESTION
         answer = row.get('text', '')
 
         # Extract raw images - store as-is
-        images = row.get('image', [])
-        if not isinstance(images, list):
-            images = [images] if images else []
+        images = self.as_image_list(row.get('image', []))
 
         return QAData(
             key=self.get_key(index),
@@ -42,6 +45,26 @@ class IAMSentencesDataset(BaseHFDataset):
             images=images
         )
 
+    def batch_extract(self, batch: Dict[str, List[Any]], indices: List[int]) -> List[QAData]:
+        """Extract IAM Sentences rows column-wise.
+
+        Args:
+            batch: Mapping of column name to the list of values in the batch
+            indices: The dataset indices of the rows in the batch
+
+        Returns:
+            List of QAData objects, one per row in the batch
+        """
+        return [
+            QAData(
+                key=self.get_key(index),
+                question=_QUESTION,
+                answer=answer,
+                images=self.as_image_list(images)
+            )
+            for index, answer, images in zip(indices, batch['text'], batch['image'])
+        ]
+
 
 if __name__ == "__main__":
     # Create the dataset
@@ -11,12 +11,21 @@ class InfoVQADataset(BaseHFDataset):
     """A class to handle loading and interacting with the InfoVQA dataset."""
 
     DATASET_NAME = "LIME-DATA/infovqa"
+    # Only these columns are decoded for batch_extract(); the first answers
+    # are read from Arrow instead of decoding the 'answers' lists
+    BATCH_COLUMNS = ['question', 'image']
 
     def __init__(self):
         """
         Initialize the dataset handler.
         """
         super().__init__(self.DATASET_NAME)
+        self._first_answers = None
+
+    def load_dataset(self, split_name: str, subset_name: str = 'default') -> None:
+        """Load a split and drop the first answers cached for the previous one."""
+        self._first_answers = None
+        super().load_dataset(split_name, subset_name)
 
     def extract_row_data(self, row: Dict[str, Any], index: int) -> QAData:
         """
@@ -53,6 +62,44 @@ class InfoVQADataset(BaseHFDataset):
             images=images
         )
 
+    def batch_extract(self, batch: Dict[str, List[Any]], indices: List[int]) -> List[QAData]:
+        """Extract InfoVQA rows column-wise.
+
+        Args:
+            batch: Mapping of column name to the list of values in the batch
+            indices: The dataset indices of the rows in the batch
+
+        Returns:
+            List of QAData objects, one per row in the batch
+        """
+        if self._first_answers is None:
+            self._first_answers = self._read_first_answers()
+        first_answers = self._first_answers
+        return [
+            QAData(
+                key=self.get_key(index),
+                question=question,
+                answer=first_answers[index],
+                images=[image] if image is not None else []
+            )
+            for index, question, image in zip(indices, batch['question'], batch['image'])
+        ]
+
+    def _read_first_answers(self) -> List[str]:
+        """Read the first answer of every row of the loaded split.
+
+        Only the first element of the 'answers' list column is converted to
+        Python; rows with no answers get an empty string. The column is read
+        through the Dataset rather than its raw Arrow table, so an indices
+        mapping from select, filter or shuffle is honoured.
+        """
+        import pyarrow.compute as pc
+
+        answers = self.dataset.select_columns(['answers']).with_format('arrow')[:].column('answers')
+        has_answer = pc.fill_null(pc.greater(pc.list_value_length(answers), 0), False)
+        first = iter(pc.fill_null(pc.list_element(pc.filter(answers, has_answer), 0), '').to_pylist())
+        return [next(first) if flag else '' for flag in has_answer.to_pylist()]
+
 
 if __name__ == "__main__":
     # Create the dataset
@@ -10,6 +10,8 @@ class KvasirVQAX1Dataset(BaseHFDataset):
     """A class to handle loading and interacting with the Kvasir VQA X1 dataset."""
 
     DATASET_NAME = "SimulaMet/Kvasir-VQA-x1"
+    # Only these columns are decoded for batch_extract()
+    BATCH_COLUMNS = ['question', 'answer', 'image']
 
     def __init__(self):
         """Initialize the Kvasir VQA X1 dataset handler.
@@ -31,9 +33,7 @@ class KvasirVQAX1Dataset(BaseHFDataset):
         answer = row.get('answer', '')
 
         # Extract raw images - store as-is
-        images = row.get('image', [])
-        if not isinstance(images, list):
-            images = [images] if images else []
+        images = self.as_image_list(row.get('image', []))
 
         return QAData(
             key=self.get_key(index),
@@ -42,6 +42,29 @@ class KvasirVQAX1Dataset(BaseHFDataset):
             images=images
         )
 
+    def batch_extract(self, batch: Dict[str, List[Any]], indices: List[int]) -> List[QAData]:
+        """Extract Kvasir VQA X1 rows column-wise.
+
+        Args:
+            batch: Mapping of column name to the list of values in the batch
+            indices: The dataset indices of the rows in the batch
+
+        Returns:
+            List of QAData objects, one per row in the batch
+        """
+        return [
+            QAData(
+                key=self.get_key(index),
+                question=question,
+                answer=answer,
+                images=self.as_image_list(images)
+            )
+            for index, question, answer, images in zip(
+                indices, batch['question'], batch['answer'], batch['image']
+            )
+        ]
+
+
 if __name__ == "__main__":
     # Create the dataset
     dset = KvasirVQAX1Dataset()
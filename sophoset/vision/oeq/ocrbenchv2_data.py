@@ -6,10 +6,15 @@ from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
 from sophoset.utils.dataset_explorer import DatasetExplorer
 
+# Every row asks the same question about its image
+_QUESTION = "What text is visible in this image?"
+
 class OCRBenchV2Dataset(BaseHFDataset):
     """A class to handle loading and interacting with the OCRBenchV2 dataset."""
 
     DATASET_NAME = "lmms-lab/OCRBench-v2"
+    # Only these columns are decoded for batch_extract()
+    BATCH_COLUMNS = ['text', 'image']
 
     def __init__(self):
         """
@@ -29,13 +34,11 @@ class OCRBenchV2Dataset(BaseHFDataset):
         Returns:
             QAData object containing the formatted row data
         """
-        question = "What text is visible in this image?"
+        question = _QUESTION
         answer = row.get('text', '')
 
         # Extract raw images - store as-is
-        images = row.get('image', [])
-        if not isinstance(images, list):
-            images = [images] if images else []
+        images = self.as_image_list(row.get('image', []))
 
         return QAData(
             key=self.get_key(index),
@@ -44,6 +47,26 @@ class OCRBenchV2Dataset(BaseHFDataset):
             images=images
         )
 
+    def batch_extract(self, batch: Dict[str, List[Any]], indices: List[int]) -> List[QAData]:
+        """Extract OCRBenchV2 rows column-wise.
+
+        Args:
+            batch: Mapping of column name to the list of values in the batch
+            indices: The dataset indices of the rows in the batch
+
+        Returns:
+            List of QAData objects, one per row in the batch
+        """
+        return [
+            QAData(
+                key=self.get_key(index),
+                question=_QUESTION,
+                answer=answer,
+                images=self.as_image_list(images)
+            )
+            for index, answer, images in zip(indices, batch['text'], batch['image'])
+        ]
+
 
 if __name__ == "__main__":
     # Create the dataset
@@ -10,6 +10,8 @@ class OlympicArenaDataset(BaseHFDataset):
     """A class to handle loading and interacting with the OlympicArena dataset."""
 
     DATASET_NAME = "GAIR/OlympicArena"
+    # Only these columns are decoded for batch_extract()
+    BATCH_COLUMNS = ['problem', 'figure_urls']
 
     def __init__(self):
         """Initialize the dataset handler."""
@@ -43,6 +45,26 @@ class OlympicArenaDataset(BaseHFDataset):
             images=images
         )
 
+    def batch_extract(self, batch: Dict[str, List[Any]], indices: List[int]) -> List[QAData]:
+        """Extract OlympicArena rows column-wise.
+
+        Args:
+            batch: Mapping of column name to the list of values in the batch
+            indices: The dataset indices of the rows in the batch
+
+        Returns:
+            List of QAData objects, one per row in the batch
+        """
+        return [
+            QAData(
+                key=self.get_key(index),
+                question=question,
+                answer='',
+                images=self.as_image_list(figure_urls)
+            )
+            for index, question, figure_urls in zip(indices, batch['problem'], batch['figure_urls'])
+        ]
+
 
 if __name__ == "__main__":
     # Create the dataset
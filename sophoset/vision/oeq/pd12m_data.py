@@ -10,6 +10,8 @@ class PD12MDataset(BaseHFDataset):
     """A class to handle loading and interacting with the PD12M dataset."""
 
     DATASET_NAME = "Spawning/PD12M"
+    # Only these columns are decoded for batch_extract()
+    BATCH_COLUMNS = ['url', 'caption']
 
     def __init__(self):
         """
@@ -41,6 +43,27 @@ class PD12MDataset(BaseHFDataset):
             answer=answer
         )
 
+    def batch_extract(self, batch: Dict[str, List[Any]], indices: List[int]) -> List[QAData]:
+        """Extract PD12M rows column-wise.
+
+        Args:
+            batch: Mapping of column name to the list of values in the batch
+            indices: The dataset indices of the rows in the batch
+
+        Returns:
+            List of QAData objects, one per row in the batch
+        """
+        return [
+            QAData(
+                key=self.get_key(index),
+                question="Describe the image in detail",
+                images=[url] if url else [],
+                answer=answer
+            )
+            for index, url, answer in zip(indices, batch['url'], batch['caption'])
+        ]
+
+
 if __name__ == "__main__":
     # Create the dataset
     dset = PD12MDataset()
@@ -10,6 +10,8 @@ class RealWorldQADataset(BaseHFDataset):
     """A class to handle loading and interacting with the RealWorldQA dataset."""
 
     DATASET_NAME = "visheratin/realworldqa"
+    # Only these columns are decoded for batch_extract()
+    BATCH_COLUMNS = ['question', 'image', 'answer']
 
     def __init__(self):
         """
@@ -48,6 +50,28 @@ class RealWorldQADataset(BaseHFDataset):
             answer=answer
         )
 
+    def batch_extract(self, batch: Dict[str, List[Any]], indices: List[int]) -> List[QAData]:
+        """Extract RealWorldQA rows column-wise.
+
+        Args:
+            batch: Mapping of column name to the list of values in the batch
+            indices: The dataset indices of the rows in the batch
+
+        Returns:
+            List of QAData objects, one per row in the batch
+        """
+        return [
+            QAData(
+                key=self.get_key(index),
+                question=question,
+                images=[image] if image is not None else [],
+                answer=answer
+            )
+            for index, question, image, answer in zip(
+                indices, batch['question'], batch['image'], batch['answer']
+            )
+        ]
+
 
 if __name__ == "__main__":
     # Create the dataset
@@ -6,10 +6,20 @@ from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
 from sophoset.utils.dataset_explorer import DatasetExplorer
 
+_get_fields = BaseHFDataset.field_getter('caption', 'image')
+
 class ROCODataset(BaseHFDataset):
     """A class to handle loading and interacting with the ROCO-Radiology dataset."""
 
     DATASET_NAME = "mdwiratathya/ROCO-radiology"
+    # Every row asks for a report on its image; the caption is the answer
+    _QUESTION = (
+        "Provide a detailed radiology report describing all relevant findings, "
+        "including anatomical structures, potential abnormalities, and clinical significance. "
+        "Be specific about locations, sizes, and any notable features."
+    )
+    # Only these columns are decoded for batch_extract()
+    BATCH_COLUMNS = ['caption', 'image']
 
     def __init__(self):
         """
@@ -29,20 +39,13 @@ class ROCODataset(BaseHFDataset):
             QAData object containing the formatted row data
         """
         # Extract basic information
-        answer = row.get('caption', '')
+        answer, image = _get_fields(row)
 
-        # Create a detailed question prompt based on the caption
-        question = (
-            "Provide a detailed radiology report describing all relevant findings, "
-            "including anatomical structures, potential abnormalities, and clinical significance. "
-            "Be specific about locations, sizes, and any notable features."
-        )
+        # The same detailed report prompt is used for every row
+        question = self._QUESTION
 
         # Extract raw images - store as-is
-        images = []
-        image = row.get('image')
-        if image is not None:
-            images.append(image)
+        images = self.as_image_list(image)
 
         # Create QAData object
         return QAData(
@@ -52,6 +55,27 @@ class ROCODataset(BaseHFDataset):
             answer=answer
         )
 
+    def batch_extract(self, batch: Dict[str, List[Any]], indices: List[int]) -> List[QAData]:
+        """Extract ROCO-radiology rows column-wise.
+
+        Args:
+            batch: Mapping of column name to the list of values in the batch
+            indices: The dataset indices of the rows in the batch
+
+        Returns:
+            List of QAData objects, one per row in the batch
+        """
+        question = self._QUESTION
+        return [
+            QAData(
+                key=self.get_key(index),
+                question=question,
+                images=self.as_image_list(image),
+                answer=answer
+            )
+            for index, answer, image in zip(indices, batch['caption'], batch['image'])
+        ]
+
 
 if __name__ == "__main__":
     # Create the dataset
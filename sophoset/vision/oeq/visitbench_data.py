@@ -6,10 +6,14 @@ from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
 from sophoset.utils.dataset_explorer import DatasetExplorer
 
+_get_fields = BaseHFDataset.field_getter('instruction', 'image', 'reference_answers')
+
 class VisitBenchDataset(BaseHFDataset):
     """A class to handle loading and interacting with the VisIT-Bench dataset."""
 
     DATASET_NAME = "mlfoundations/VisIT-Bench"
+    # Only these columns are decoded for batch_extract()
+    BATCH_COLUMNS = ['instruction', 'image', 'reference_answers']
 
     def __init__(self):
         """Initialize the dataset handler."""
@@ -27,19 +31,15 @@ class VisitBenchDataset(BaseHFDataset):
             QAData object containing the formatted row data
         """
         # Extract basic information
-        instruction = row.get('instruction', '')
+        instruction, image, reference_answers = _get_fields(row)
 
         # Extract raw images - store as-is
-        images = []
-        image = row.get('image')
-        if image is not None:
-            images.append(image)
+        images = self.as_image_list(image)
 
         # Format the question with any additional context
         question = instruction
 
-        # Get reference answers if available
-        reference_answers = row.get('reference_answers', [])
+        # Use the first reference answer if available
         answer = reference_answers[0] if reference_answers else ""
 
         # Create QAData object
@@ -50,6 +50,28 @@ class VisitBenchDataset(BaseHFDataset):
             answer=answer
         )
 
+    def batch_extract(self, batch: Dict[str, List[Any]], indices: List[int]) -> List[QAData]:
+        """Extract VisIT-Bench rows column-wise.
+
+        Args:
+            batch: Mapping of column name to the list of values in the batch
+            indices: The dataset indices of the rows in the batch
+
+        Returns:
+            List of QAData objects, one per row in the batch
+        """
+        return [
+            QAData(
+                key=self.get_key(index),
+                question=instruction,
+                images=self.as_image_list(image),
+                answer=reference_answers[0] if reference_answers else ""
+            )
+            for index, instruction, image, reference_answers in zip(
+                indices, batch['instruction'], batch['image'], batch['reference_answers']
+            )
+        ]
+
 
 if __name__ == "__main__":
     # Create the dataset
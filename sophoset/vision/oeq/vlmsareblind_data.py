@@ -6,10 +6,14 @@ from sophoset.core.base_hf_dataset import BaseHFDataset, QAData
 from sophoset.utils.dataset_exporter import DatasetExporter
 from sophoset.utils.dataset_explorer import DatasetExplorer
 
+_get_fields = BaseHFDataset.field_getter('question', 'answer', 'image')
+
 class VLMsAreBlindDataset(BaseHFDataset):
     """A class to handle loading and interacting with the VLMsAreBlind dataset."""
 
     DATASET_NAME = "XAI/vlmsareblind"
+    # Only these columns are decoded for batch_extract()
+    BATCH_COLUMNS = ['question', 'answer', 'image']
 
     def __init__(self):
         """Initialize the dataset handler."""
@@ -27,14 +31,10 @@ class VLMsAreBlindDataset(BaseHFDataset):
             QAData object containing the formatted row data
         """
         # Extract basic information
-        question = row.get('question', '')
-        answer = row.get('answer', '')
+        question, answer, image = _get_fields(row)
 
         # Extract raw images - store as-is
-        images = []
-        image = row.get('image')
-        if image is not None:
-            images.append(image)
+        images = self.as_image_list(image)
 
         # Create QAData object
         return QAData(
@@ -44,6 +44,29 @@ class VLMsAreBlindDataset(BaseHFDataset):
             answer=answer
         )
 
+    def batch_extract(self, batch: Dict[str, List[Any]], indices: List[int]) -> List[QAData]:
+        """Extract VLMsAreBlind rows column-wise.
+
+        Args:
+            batch: Mapping of column name to the list of values in the batch
+            indices: The dataset indices of the rows in the batch
+
+        Returns:
+            List of QAData objects, one per row in the batch
+        """
+        return [
+            QAData(
+                key=self.get_key(index),
+                question=question,
+                images=self.as_image_list(image),
+                answer=answer
+            )
+            for index, question, answer, image in zip(
+                indices, batch['question'], batch['answer'], batch['image']
+            )
+        ]
+
+
 if __name__ == "__main__":
     # Create the dataset
     dset = VLMsAreBlindDataset()
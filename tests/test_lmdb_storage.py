@@ -0,0 +1,32 @@
+"""Tests for sophoset.utils.lmdb_storage."""
+
+import pytest
+
+from sophoset.utils.lmdb_storage import Config, LMDBStorage
+
+
+@pytest.fixture(params=["pickle", "json"])
+def storage(request, tmp_path):
+    """An empty storage in a temporary directory, for each serializer."""
+    with LMDBStorage(Config(db_path=str(tmp_path / "db"), serializer=request.param)) as storage:
+        yield storage
+
+
+def test_put_get_has_key_round_trip(storage):
+    value = {"question": "What is 2+2?", "answer": "4", "padding": "x" * 1000}
+
+    assert storage.put("default/test/0", value)
+
+    assert storage.get("default/test/0") == value
+    assert storage.has_key("default/test/0")
+    assert not storage.has_key("default/test/1")
+    assert storage.get("default/test/1", "missing") == "missing"
+
+
+def test_prefix_exists(storage):
+    storage.put("default/train/0", "a")
+
+    assert storage.prefix_exists("default/train/")
+    assert storage.prefix_exists("default/")
+    assert not storage.prefix_exists("default/test/")
+    assert not storage.prefix_exists("zzz")